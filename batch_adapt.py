@@ -0,0 +1,87 @@
+"""
+Adaptation des CV par lots, sur tous les cœurs
+
+Les offres sont lues en flux depuis la base (jamais toutes en mémoire) et
+envoyées par paquets de CV_CONFIG["batch_chunk_size"] à un pool de
+processus. Chaque processus prépare une seule fois le modèle de CV et le
+matcher des profils (initializer), puis adapte ses paquets sans attente
+entre les offres. Les résultats sont écrits par transaction groupée, un
+paquet à la fois ; seuls quelques paquets sont en cours à un instant donné.
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List
+
+from config import *
+from keyword_matcher import get_profile_matcher
+from job_automation_system import CVAdapterFree, JobDatabase, JobOffer
+
+# État propre à chaque processus du pool (préparé par _init_worker)
+_worker: Dict = {}
+
+def _init_worker(base_cv: str):
+    _worker["adapter"] = CVAdapterFree(base_cv)
+    _worker["profiles"] = get_profile_matcher(SEARCH_PROFILES)
+
+def _adapt_chunk(offers: List[tuple]) -> List[tuple]:
+    """Adapte un paquet d'offres ; retourne [(id, cv, profil, mots-clés)]"""
+    adapter = _worker["adapter"]
+    profiles = _worker["profiles"]
+    results = []
+    for job_id, title, company, description in offers:
+        job = JobOffer(id=job_id, title=title or "", company=company or "", location="",
+                       description=description or "", requirements="", salary=None, url="",
+                       source="", date_scraped=None)
+        match = profiles.best(job.title, job.description)
+        cv = adapter.adapt_cv_for_job(job, get_profile_config(match.profile), match)
+        results.append((job_id, cv, match.profile, job.keywords))
+    return results
+
+class BatchAdapter:
+    """Adapte le CV de toutes les offres d'un statut avec un ProcessPoolExecutor"""
+
+    def __init__(self, db: JobDatabase, base_cv: str = None, workers: int = None, chunk_size: int = None):
+        self.db = db
+        self.base_cv = base_cv if base_cv is not None else CVAdapterFree().base_cv
+        self.workers = workers or CV_CONFIG["batch_workers"] or os.cpu_count() or 1
+        self.chunk_size = chunk_size or CV_CONFIG["batch_chunk_size"]
+
+    def _pending(self, status: str, force: bool) -> Iterator[tuple]:
+        """(id, titre, entreprise, description) des offres à adapter, en flux"""
+        rows = self.db.iter_rows(["id", "title", "company", "description", "cv_hash"], status=status)
+        for job_id, title, company, description, cv_hash in rows:
+            if force or not cv_hash:
+                yield job_id, title, company, description
+
+    def run(self, status: str = "scraped", force: bool = False, limit: int = None) -> Dict[str, float]:
+        """Adapte les offres de `status` (sans CV adapté, sauf `force`)"""
+        self.db.flush()
+        pending = islice(self._pending(status, force), limit)
+        chunks = iter(lambda: list(islice(pending, self.chunk_size)), [])
+
+        start = time.perf_counter()
+        adapted = 0
+        with ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(self.base_cv,)) as executor:
+            # Deux paquets en attente par processus : les cœurs restent occupés
+            # pendant l'écriture, sans lire toute la base d'avance
+            in_flight = deque()
+            for chunk in chunks:
+                in_flight.append(executor.submit(_adapt_chunk, chunk))
+                if len(in_flight) >= 2 * self.workers:
+                    adapted += self._save(in_flight.popleft().result())
+            while in_flight:
+                adapted += self._save(in_flight.popleft().result())
+
+        self.db.flush()
+        elapsed = time.perf_counter() - start
+        rate = adapted / elapsed if elapsed else 0.0
+        print(f"✍️  {adapted} CV adaptés en {elapsed:.1f} s ({rate:.0f} offres/s, {self.workers} processus)")
+        return {"adapted": adapted, "seconds": round(elapsed, 2), "per_second": round(rate, 1)}
+
+    def _save(self, results: List[tuple]) -> int:
+        self.db.save_adaptations(results, self.base_cv)
+        return len(results)
@@ -0,0 +1,175 @@
+"""
+Micro-benchmarks hors ligne des étapes coûteuses du pipeline
+
+Usage:
+    python benchmark.py parse [--pages DOSSIER] [--repeat N]
+    python benchmark.py keywords [--offers N] [--repeat N]
+    python benchmark.py scoring [--offers N] [--repeat N]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from config import *
+
+# Pages enregistrées servant aux tests des parsers (tests/test_sites.py)
+FIXTURES_DIR = Path(__file__).resolve().parent / "tests" / "fixtures" / "sites"
+
+def _timeit(fn: Callable, repeat: int) -> List[float]:
+    """Durées (secondes) de `repeat` exécutions de fn"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+def _report(label: str, durations: List[float], unit_count: int = 1, unit: str = "page"):
+    per_unit = statistics.median(durations) / max(unit_count, 1)
+    print(f"  {label:<40} {per_unit * 1000:8.3f} ms/{unit}")
+
+def synthetic_indeed_page(cards: int = 15) -> str:
+    """Page de résultats Indeed factice (structure des vraies cartes)"""
+    items = "".join(
+        f'<li><div class="job_seen_beacon" data-jk="{i:016x}"><table><tr><td>'
+        f'<h2 class="jobTitle"><a id="job_{i:016x}"><span title="Data Scientist {i}">Data Scientist {i}</span></a></h2>'
+        f'<div class="company_location"><span data-testid="company-name">Entreprise {i}</span>'
+        f'<div data-testid="job-location">Paris ({i % 20})</div></div>'
+        f'<div class="job-snippet"><ul><li>Python, SQL et machine learning</li></ul></div>'
+        f'</td></tr></table></div></li>'
+        for i in range(cards)
+    )
+    scripts = "<script>" + "var x = 1;" * 5000 + "</script>"
+    return f"<html><head>{scripts}</head><body><ul id='mosaic-provider-jobcards'>{items}</ul></body></html>"
+
+def load_pages(pages_dir: Path) -> List[str]:
+    """Pages HTML sauvegardées (*.html), sinon pages de résultats du cache HTTP,
+    sinon la page Indeed des fixtures de test, sinon une page factice"""
+    if pages_dir and pages_dir.exists():
+        pages = [path.read_text(encoding="utf-8") for path in sorted(pages_dir.glob("*.html"))]
+        if pages:
+            return pages
+    if HTTP_CACHE_CONFIG["path"].exists():
+        from http_cache import ResponseCache
+        cache = ResponseCache()
+        pages = [text for _, text in cache.iter_bodies("indeed.com/jobs")]
+        cache.close()
+        if pages:
+            return pages
+    fixture = FIXTURES_DIR / "indeed_listing.html"
+    if fixture.exists():
+        print(f"ℹ️  Aucune page sauvegardée ni en cache : utilisation de {fixture.name}")
+        return [fixture.read_text(encoding="utf-8")]
+    print("ℹ️  Aucune page sauvegardée ni en cache : utilisation d'une page factice")
+    return [synthetic_indeed_page()]
+
+def bench_parse(pages_dir: Path, repeat: int):
+    """Coût du parsing d'une page de résultats"""
+    from bs4 import BeautifulSoup
+    from sites import parse_indeed_listing
+
+    pages = load_pages(pages_dir)
+    cards = sum(len(parse_indeed_listing(page)) for page in pages)
+    print(f"📄 {len(pages)} page(s), {cards} carte(s)")
+
+    def parse_compiled():
+        for page in pages:
+            parse_indeed_listing(page)
+
+    def parse_beautifulsoup():
+        # Référence : sélecteurs CSS BeautifulSoup appliqués carte par carte
+        for page in pages:
+            soup = BeautifulSoup(page, "lxml")
+            for card in soup.select("[data-jk]"):
+                card.select_one("h2 a span")
+                card.select_one("[data-testid='company-name']")
+                card.select_one("[data-testid='job-location']")
+
+    _report("lxml + XPath compilés (sites.py)", _timeit(parse_compiled, repeat), len(pages))
+    _report("BeautifulSoup + select (référence)", _timeit(parse_beautifulsoup, repeat), len(pages))
+
+def synthetic_descriptions(count: int, words: int = 400, seed: int = 42) -> List[str]:
+    """Descriptions d'offres factices mêlant vocabulaire courant et mots-clés des profils"""
+    rng = random.Random(seed)
+    keywords = [keyword for profile in SEARCH_PROFILES.values() for keyword in profile["target_keywords"]]
+    filler = ("équipe", "projet", "maintenance", "données", "clients", "développer", "mission", "détail",
+              "entreprise", "expérience", "paris", "télétravail", "analyse", "innovation", "produit")
+    return [
+        " ".join(rng.choice(keywords) if rng.random() < 0.05 else rng.choice(filler) for _ in range(words))
+        for _ in range(count)
+    ]
+
+def bench_keywords(offers: int, repeat: int):
+    """Coût de la recherche des mots-clés d'un profil dans une offre"""
+    from keyword_matcher import get_matcher
+
+    descriptions = synthetic_descriptions(offers)
+    keywords = SEARCH_PROFILES["data_scientist"]["target_keywords"]
+    print(f"📄 {offers} offres de {len(descriptions[0].split())} mots")
+
+    # Profil réel, puis liste dix fois plus longue (mots-clés factices en plus)
+    extra = [f"outil{i}" for i in range(len(keywords) * 9)]
+    for keyword_list in (keywords, keywords + extra):
+        print(f"  {len(keyword_list)} mots-clés")
+
+        def substring_scan():
+            # Référence : ancienne version (un `in` par mot-clé, sous-chaînes)
+            for text in descriptions:
+                text = text.lower()
+                [keyword for keyword in keyword_list if keyword.lower() in text]
+
+        matcher = get_matcher(tuple(keyword_list))
+
+        def compiled_matcher():
+            for text in descriptions:
+                matcher.find_all(text)
+
+        _report("regex compilée (keyword_matcher.py)", _timeit(compiled_matcher, repeat), offers, "offre")
+        _report("`in` par mot-clé (référence)", _timeit(substring_scan, repeat), offers, "offre")
+
+    matcher = get_matcher(tuple(keywords))
+    false_hits = sum(
+        len({keyword for keyword in keywords if keyword in text.lower()} - set(matcher.find_all(text)))
+        for text in descriptions
+    )
+    print(f"  Correspondances partielles évitées (ex. 'ai' dans 'maintenance'): {false_hits}")
+
+def bench_scoring(offers: int, repeat: int):
+    """Coût du score TF-IDF de tout un corpus (vectorisation + similarités)"""
+    from scoring import TfidfScorer
+
+    descriptions = synthetic_descriptions(offers, words=300)
+    print(f"📄 {offers} offres de {len(descriptions[0].split())} mots, {len(SEARCH_PROFILES)} profils")
+
+    base_cv = synthetic_descriptions(1, seed=7)[0]
+
+    def score_corpus():
+        TfidfScorer(base_cv=base_cv).score(descriptions)
+
+    durations = _timeit(score_corpus, repeat)
+    print(f"  Corpus complet: {statistics.median(durations):.2f} s")
+    _report("TF-IDF + cosinus (scoring.py)", durations, offers, "offre")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks hors ligne")
+    parser.add_argument("bench", choices=["parse", "keywords", "scoring"], help="Benchmark à lancer")
+    parser.add_argument("--pages", type=Path, default=DATA_DIR / "pages",
+                        help="Dossier de pages HTML sauvegardées")
+    parser.add_argument("--offers", type=int, default=5000, help="Nombre d'offres factices")
+    parser.add_argument("--repeat", type=int, default=20, help="Nombre de répétitions")
+    args = parser.parse_args()
+
+    print(f"⏱️  Benchmark: {args.bench}")
+    if args.bench == "parse":
+        bench_parse(args.pages, args.repeat)
+    elif args.bench == "keywords":
+        bench_keywords(args.offers, args.repeat)
+    elif args.bench == "scoring":
+        bench_scoring(args.offers, args.repeat)
+
+if __name__ == "__main__":
+    main()
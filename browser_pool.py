@@ -0,0 +1,188 @@
+"""
+Pool de navigateurs Chrome partagé par le scraper et le bot de candidature
+
+Les navigateurs sont démarrés au premier besoin, réutilisés d'une page à
+l'autre et recyclés après un certain nombre de pages ou si leur mémoire
+JavaScript grossit trop.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config import *
+
+# Intervalle de vérification des conditions d'attente (secondes)
+POLL_FREQUENCY = 0.1
+
+# Requêtes bloquées quand SELENIUM_CONFIG["block_fonts"] est actif
+FONT_URL_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*"]
+
+def wait_until_ready(driver, css_selector: str, timeout: float = None) -> bool:
+    """Attend qu'un élément correspondant à `css_selector` soit présent
+
+    Retourne False si le délai (SELENIUM_CONFIG["implicit_wait"]) expire :
+    page sans résultat ou structure inattendue, le parsing tranchera.
+    """
+    timeout = timeout if timeout is not None else SELENIUM_CONFIG["implicit_wait"]
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(EC.presence_of_element_located((By.CSS_SELECTOR, css_selector)))
+        return True
+    except TimeoutException:
+        return False
+
+def dismiss_cookie_banner(driver, button_id: str, timeout: float = None) -> bool:
+    """Ferme le bandeau cookies s'il est affiché (sans attendre s'il est absent)"""
+    timeout = timeout if timeout is not None else SELENIUM_CONFIG["implicit_wait"]
+    buttons = driver.find_elements(By.ID, button_id)
+    if not buttons or not buttons[0].is_displayed():
+        return False
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(EC.element_to_be_clickable((By.ID, button_id))).click()
+        WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(EC.invisibility_of_element_located((By.ID, button_id)))
+        return True
+    except (TimeoutException, WebDriverException):
+        return False
+
+class _PooledBrowser:
+    """Navigateur du pool et son compteur de pages"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+
+class BrowserPool:
+    """Pool de drivers Selenium à démarrage paresseux"""
+
+    def __init__(self, max_browsers: int = None, max_pages_per_browser: int = None,
+                 max_js_heap_mb: int = None):
+        self.max_browsers = max_browsers or SELENIUM_CONFIG["max_browsers"]
+        self.max_pages_per_browser = max_pages_per_browser or SELENIUM_CONFIG["max_pages_per_browser"]
+        self.max_js_heap_mb = max_js_heap_mb or SELENIUM_CONFIG["max_js_heap_mb"]
+
+        self._slots = threading.BoundedSemaphore(self.max_browsers)
+        self._lock = threading.Lock()
+        self._idle: List[_PooledBrowser] = []
+        self._closed = False
+        self.started = 0
+        self.recycled = 0
+        self._timings: Dict[str, List[float]] = {}
+
+    @contextmanager
+    def browser(self):
+        """Emprunte un navigateur pour charger une page
+
+        Bloque si `max_browsers` navigateurs sont déjà utilisés.
+        """
+        self._slots.acquire()
+        entry = None
+        try:
+            with self._lock:
+                entry = self._idle.pop() if self._idle else None
+            if entry is None:
+                entry = _PooledBrowser(self._create_driver())
+
+            yield entry.driver
+            entry.pages += 1
+        finally:
+            if entry is not None:
+                self._release(entry)
+            self._slots.release()
+
+    def _release(self, entry: _PooledBrowser):
+        """Remet un navigateur dans le pool, ou le ferme s'il doit être recyclé"""
+        if self._closed or self._needs_recycle(entry):
+            self._quit(entry)
+            if not self._closed:
+                self.recycled += 1
+            return
+        with self._lock:
+            self._idle.append(entry)
+
+    def _needs_recycle(self, entry: _PooledBrowser) -> bool:
+        if entry.pages >= self.max_pages_per_browser:
+            return True
+        try:
+            heap = entry.driver.execute_script(
+                "return (window.performance && performance.memory) ? performance.memory.usedJSHeapSize : 0"
+            )
+        except Exception:
+            return True  # Navigateur planté ou déconnecté : on le remplace
+        return (heap or 0) / (1024 * 1024) > self.max_js_heap_mb
+
+    def _create_driver(self):
+        """Démarre un nouveau Chrome configuré selon SELENIUM_CONFIG"""
+        chrome_options = Options()
+        if SELENIUM_CONFIG["headless"]:
+            chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument(f"--user-agent={SELENIUM_CONFIG['user_agent']}")
+        chrome_options.page_load_strategy = SELENIUM_CONFIG["page_load_strategy"]
+        if SELENIUM_CONFIG["block_images"]:
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+        try:
+            driver = webdriver.Chrome(options=chrome_options)
+            driver.set_window_size(*SELENIUM_CONFIG["window_size"])
+            driver.set_page_load_timeout(SELENIUM_CONFIG["page_load_timeout"])
+            if SELENIUM_CONFIG["block_fonts"]:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": FONT_URL_PATTERNS})
+        except Exception as e:
+            print(f"❌ Erreur configuration Chrome: {e}")
+            print("📝 Installez ChromeDriver: https://chromedriver.chromium.org/")
+            raise
+
+        self.started += 1
+        print(f"🌐 Navigateur démarré ({self.started} depuis le lancement)")
+        return driver
+
+    @staticmethod
+    def _quit(entry: _PooledBrowser):
+        try:
+            entry.driver.quit()
+        except Exception:
+            pass
+
+    @contextmanager
+    def timed(self, kind: str):
+        """Mesure la durée d'une opération navigateur (chargement + attente de la page)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._timings.setdefault(kind, []).append(time.perf_counter() - start)
+
+    def timing_stats(self) -> Dict[str, Dict[str, float]]:
+        """Nombre de pages et durée moyenne / maximale (secondes) par type d'opération"""
+        with self._lock:
+            timings = {kind: list(durations) for kind, durations in self._timings.items()}
+        return {
+            kind: {"count": len(durations), "mean": sum(durations) / len(durations), "max": max(durations)}
+            for kind, durations in timings.items() if durations
+        }
+
+    def stats(self) -> Dict[str, int]:
+        """Navigateurs démarrés, recyclés et disponibles"""
+        with self._lock:
+            idle = len(self._idle)
+        return {"started": self.started, "recycled": self.recycled, "idle": idle}
+
+    def close(self):
+        """Ferme tous les navigateurs (ceux en cours d'utilisation à leur retour)"""
+        self._closed = True
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for entry in idle:
+            self._quit(entry)
@@ -138,6 +138,20 @@ SITES_CONFIG = {
         "base_url": "https://www.welcometothejungle.com/fr/jobs",
         "priority": 3,
         "delay_between_requests": (2, 4),
+    },
+    
+    "hellowork": {
+        "enabled": True,
+        "base_url": "https://www.hellowork.com/fr-fr/emploi/recherche.html",
+        "priority": 4,
+        "delay_between_requests": (2, 4),
+    },
+    
+    "monster": {
+        "enabled": False,
+        "base_url": "https://www.monster.fr/emploi/recherche",
+        "priority": 5,
+        "delay_between_requests": (3, 6),
     }
 }
 
@@ -191,7 +205,19 @@ CV_CONFIG = {
         "max_keywords_per_section": 5,
         "synonym_replacement": True,
         "preserve_achievements": True
-    }
+    },
+    
+    # CV adaptés gardés en mémoire (par catégorie de poste et mots-clés)
+    "render_cache_size": 1024,
+    
+    # Le profil le plus proche (ProfileMatcher) ne choisit le titre du CV que
+    # s'il figure dans le titre de l'offre (score >= 1) ou si cette part de
+    # ses mots-clés est trouvée ; sinon le titre de l'offre décide
+    "profile_title_min_score": 0.3,
+    
+    # Adaptation en lot (python startup.py adapt)
+    "batch_workers": None,  # Processus ; None = nombre de cœurs
+    "batch_chunk_size": 200  # Offres envoyées à un processus à la fois
 }
 
 # =============================================================================
@@ -200,9 +226,30 @@ CV_CONFIG = {
 
 DATABASE_CONFIG = {
     "path": DATA_DIR / "jobs.db",
-    "backup_frequency": "daily",
+    "backup_frequency": "daily",  # hourly, daily, weekly
+    "backup_dir": DATA_DIR / "backups",
+    "backup_keep": 7,  # Nombre de sauvegardes conservées
+    "backup_pages_per_step": 256,  # Pages copiées par étape de sauvegarde à chaud
     "cleanup_old_jobs_days": 90,
-    "export_formats": ["csv", "excel"]
+    "archive_path": DATA_DIR / "jobs_archive.db",  # Offres purgées
+    "purge_batch_size": 500,
+    "vacuum_pages": 1000,  # Pages libérées par vacuum incrémental
+    "export_formats": ["csv", "excel", "parquet"],  # parquet nécessite pyarrow
+    "export_dir": DATA_DIR / "exports",
+    "export_chunk_size": 5000,  # Lignes lues et écrites par paquet
+    
+    # Connexion persistante (une par thread) et pragmas SQLite
+    "journal_mode": "WAL",  # Lectures concurrentes pendant les écritures
+    "synchronous": "NORMAL",  # Suffisant en WAL, évite un fsync par commit
+    "cache_size_kb": 20000,
+    "busy_timeout_ms": 5000,
+    "batch_size": 1000,  # Lignes par executemany lors des insertions groupées
+    
+    # Thread d'écriture unique (commits groupés, producteurs non bloquants)
+    "async_writes": True,
+    "writer_max_batch": 500,  # Opérations max par commit groupé
+    "writer_max_delay_ms": 50,  # Attente max pour regrouper des écritures
+    "writer_queue_size": 10000  # Au-delà, les producteurs attendent le disque
 }
 
 # =============================================================================
@@ -225,9 +272,82 @@ SELENIUM_CONFIG = {
     "headless": True,
     "window_size": (1920, 1080),
     "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-    "implicit_wait": 10,
+    "implicit_wait": 10,  # Attente maximale d'une condition (élément présent, cliquable...)
     "page_load_timeout": 30,
-    "download_dir": DATA_DIR / "downloads"
+    # "eager" : driver.get rend la main dès que le DOM est prêt, sans
+    # attendre images, polices et scripts tiers
+    "page_load_strategy": "eager",
+    "block_images": True,
+    "block_fonts": True,
+    "download_dir": DATA_DIR / "downloads",
+    
+    # Pool de navigateurs partagé (démarrage à la demande)
+    "max_browsers": 2,  # Navigateurs ouverts simultanément au maximum
+    "max_pages_per_browser": 50,  # Recyclage après ce nombre de pages
+    "max_js_heap_mb": 512  # Recyclage si la mémoire JavaScript dépasse ce seuil
+}
+
+# =============================================================================
+# CONFIGURATION HTTP (récupération des pages sans navigateur)
+# =============================================================================
+
+HTTP_CONFIG = {
+    "timeout": 15,  # secondes
+    "max_retries": 2,
+    "backoff_factor": 0.5,
+    "pool_connections": 10,  # Nombre d'hôtes gardés en keep-alive
+    "pool_maxsize": 10,  # Connexions simultanées par hôte
+    "max_concurrent_pages": 4,  # Pages récupérées en parallèle
+    "default_delay_between_requests": (2, 5),  # Hôtes absents de SITES_CONFIG
+    "burst_per_host": 1,  # Requêtes pouvant partir sans délai après une pause
+    "headers": {
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8",
+        "Accept-Encoding": "gzip, deflate",
+    }
+}
+
+HTTP_CACHE_CONFIG = {
+    # "off", "cache" (réseau si absente ou expirée), "record" (toujours le
+    # réseau, tout est enregistré), "replay" (cache seul, hors ligne)
+    "mode": os.getenv("HTTP_CACHE_MODE", "cache"),
+    "path": DATA_DIR / "http_cache.db",
+    "ttl_hours": 1,
+    "max_size_mb": 200,
+    "compression_level": 6
+}
+
+# =============================================================================
+# CONFIGURATION CRAWL
+# =============================================================================
+
+CRAWL_CONFIG = {
+    # Mode incrémental : ignore les offres déjà en base et arrête la
+    # pagination quand une page est majoritairement connue
+    "incremental": True,
+    "stop_when_known_ratio": 0.8,
+    # Enrichissement : récupération des descriptions complètes des offres
+    "enrich_descriptions": True,
+    "max_descriptions_per_cycle": 200,
+    "enrichment_batch_size": 50,  # Descriptions écrites par transaction
+    # En deçà de cet âge, une description en cache est réutilisée sans requête ;
+    # au-delà, elle est revalidée (If-None-Match / If-Modified-Since)
+    "description_cache_fresh_hours": 24,
+    # Doublons (même offre sur plusieurs sites ou republiée) : empreintes
+    # SimHash 64 bits, doublon si au plus ce nombre de bits diffère (<= 5)
+    "deduplicate": True,
+    "simhash_max_distance": 5
+}
+
+# =============================================================================
+# CONFIGURATION SCORE DE PERTINENCE
+# =============================================================================
+
+SCORING_CONFIG = {
+    # Score = keyword_weight * similarité avec les target_keywords du profil
+    #       + cv_weight * similarité avec le CV de base (TF-IDF, cosinus)
+    "keyword_weight": 0.7,
+    "cv_weight": 0.3
 }
 
 # =============================================================================
@@ -253,6 +373,9 @@ def validate_config() -> bool:
     if not SEARCH_PROFILES:
         errors.append("Aucun profil de recherche défini")
     
+    if HTTP_CACHE_CONFIG["mode"] not in ("off", "cache", "record", "replay"):
+        errors.append(f"Mode de cache HTTP inconnu: {HTTP_CACHE_CONFIG['mode']}")
+    
     if errors:
         print("❌ Erreurs de configuration:")
         for error in errors:
@@ -269,34 +392,13 @@ def validate_config() -> bool:
 
 def extract_keywords_basic(job_title: str, job_description: str, profile_keywords: list) -> list:
     """Extraction basique de mots-clés (sans IA)"""
-    text = f"{job_title} {job_description}".lower()
-    found_keywords = []
-    
-    for keyword in profile_keywords:
-        if keyword.lower() in text:
-            found_keywords.append(keyword)
+    from keyword_matcher import get_matcher
     
+    found_keywords = get_matcher(tuple(profile_keywords)).find_all(f"{job_title} {job_description}")
     return found_keywords[:10]  # Max 10 mots-clés
 
 def adapt_cv_basic(base_cv: str, keywords: list, profile_config: dict) -> str:
     """Adaptation basique du CV (sans IA)"""
-    adapted_cv = base_cv
-    
-    # Remplace le titre si nécessaire
-    if "data scientist" in keywords:
-        adapted_cv = adapted_cv.replace(
-            "CDI DATA & IA | SCRUM MASTER & GESTION DE PROJET AGILE",
-            "DATA SCIENTIST | MACHINE LEARNING & INTELLIGENCE ARTIFICIELLE"
-        )
-    elif "scrum master" in [k.lower() for k in keywords]:
-        adapted_cv = adapted_cv.replace(
-            "CDI DATA & IA | SCRUM MASTER & GESTION DE PROJET AGILE", 
-            "SCRUM MASTER | GESTION DE PROJET AGILE & TRANSFORMATION DIGITALE"
-        )
-    
-    # Ajoute les mots-clés trouvés dans une section dédiée
-    if keywords:
-        keywords_section = f"\n\nMOTS-CLÉS TECHNIQUES RECHERCHÉS\n{', '.join(keywords[:8])}"
-        adapted_cv += keywords_section
+    from cv_template import get_template  # Import local : cv_template importe config
     
-    return adapted_cv
+    return get_template(base_cv).adapt(keywords)
@@ -0,0 +1,117 @@
+"""
+Planification des requêtes : limitation de débit par hôte et crawl concurrent
+
+Chaque hôte a son propre seau à jetons, réglé sur le délai de politesse
+déclaré dans SITES_CONFIG[...]["delay_between_requests"] : les pages sont
+récupérées en parallèle aussi vite que ces délais le permettent, sans pause
+fixe entre deux pages.
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, Iterable, Iterator, Tuple, Any
+from urllib.parse import urlparse
+
+from config import *
+
+class TokenBucket:
+    """Seau à jetons : un jeton par requête, remplissage à rythme aléatoire
+
+    L'intervalle entre deux jetons est tiré dans `delay_range` (secondes) ;
+    `burst` jetons peuvent être accumulés quand l'hôte n'est pas sollicité.
+    """
+
+    def __init__(self, delay_range: Tuple[float, float], burst: int = 1):
+        self.delay_range = delay_range
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._next_delay = random.uniform(*delay_range)
+        self._last_refill = time.monotonic()
+
+    def _refill(self, now: float):
+        while self._tokens < self.burst and now - self._last_refill >= self._next_delay:
+            self._last_refill += self._next_delay
+            self._tokens += 1
+            self._next_delay = random.uniform(*self.delay_range)
+        if self._tokens >= self.burst:
+            self._last_refill = now
+
+    def acquire(self) -> float:
+        """Prend un jeton, en attendant si nécessaire ; retourne le temps attendu"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = self._last_refill + self._next_delay - now
+            time.sleep(max(delay, 0.001))
+            waited += max(delay, 0.001)
+
+class HostRateLimiter:
+    """Un seau à jetons par hôte, délais tirés de SITES_CONFIG"""
+
+    def __init__(self, sites_config: Dict = None):
+        sites_config = sites_config or SITES_CONFIG
+        self._delays = {
+            urlparse(site["base_url"]).netloc: site["delay_between_requests"]
+            for site in sites_config.values()
+        }
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                delay_range = self._delays.get(host, HTTP_CONFIG["default_delay_between_requests"])
+                self._buckets[host] = TokenBucket(delay_range, HTTP_CONFIG["burst_per_host"])
+            return self._buckets[host]
+
+    def wait(self, url: str) -> float:
+        """Attend le droit d'envoyer une requête à l'hôte de `url`"""
+        return self.bucket_for(url).acquire()
+
+class CrawlScheduler:
+    """Exécute des tâches de crawl en parallèle (nombre de tâches en vol borné)"""
+
+    def __init__(self, max_workers: int = None):
+        self.max_workers = max_workers or HTTP_CONFIG["max_concurrent_pages"]
+
+    def run(self, items: Iterable[Any], task: Callable[[Any], Any]) -> Iterator[Tuple[Any, Any]]:
+        """Applique `task` à chaque élément et produit (élément, résultat) dès qu'ils sont prêts
+
+        Les éléments sont consommés au fur et à mesure : si l'appelant arrête
+        d'itérer, aucune nouvelle tâche n'est lancée. Une exception levée par
+        une tâche est renvoyée comme résultat.
+        """
+        items = iter(items)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="crawl") as executor:
+            pending = {}
+
+            def submit_next() -> bool:
+                for item in items:
+                    pending[executor.submit(task, item)] = item
+                    return True
+                return False
+
+            for _ in range(self.max_workers):
+                if not submit_next():
+                    break
+
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        item = pending.pop(future)
+                        error = future.exception()
+                        yield item, error if error is not None else future.result()
+                        submit_next()
+            finally:
+                for future in pending:
+                    future.cancel()
@@ -0,0 +1,191 @@
+"""
+Adaptation du CV par emplacements (modèle analysé une seule fois)
+
+Le CV de base est découpé une fois en blocs (paragraphes) rattachés à leur
+section : titre, expériences, compétences... L'adaptation ne fait plus de
+str.replace sur tout le texte : elle remplit des emplacements (titre,
+ordre des puces, bloc de mots-clés) puis assemble les blocs.
+
+Le rendu dépend seulement de la catégorie du poste et de l'ensemble
+normalisé des mots-clés : il est mémorisé (LRU), une adaptation déjà vue
+ne coûte qu'une recherche dans le cache.
+
+Les options CV_CONFIG["adaptable_sections"] et ["adaptation_rules"] sont
+appliquées :
+- title : titre du CV selon la catégorie du poste ;
+- skills / experience_descriptions : puces citant les mots-clés en premier ;
+- keywords_integration : bloc des compétences mises en avant ;
+- keep_structure : les puces ne changent pas de bloc (sinon les blocs de
+  compétences sont aussi triés) ;
+- max_keywords_per_section : nombre de mots-clés retenus ;
+- synonym_replacement : "ml" et "machine learning" ne font qu'un ;
+- preserve_achievements : les puces chiffrées (30 %...) gardent leur place.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import *
+from keyword_matcher import fold, get_matcher
+
+# (catégorie, marqueurs cherchés dans le titre de l'offre, titre du CV)
+TITLE_RULES = (
+    ("data_scientist", ("data scientist", "scientist"),
+     "DATA SCIENTIST | MACHINE LEARNING & INTELLIGENCE ARTIFICIELLE"),
+    ("scrum_master", ("scrum master", "scrum", "agile", "project manager"),
+     "SCRUM MASTER | GESTION DE PROJET AGILE & TRANSFORMATION DIGITALE"),
+    ("data_analyst", ("data analyst", "analyst"),
+     "DATA ANALYST | BUSINESS INTELLIGENCE & VISUALISATION DE DONNÉES"),
+)
+CATEGORY_TITLES = {category: title for category, _, title in TITLE_RULES}
+
+# Variantes d'un même mot-clé -> forme retenue
+KEYWORD_SYNONYMS = {
+    "ml": "machine learning",
+    "apprentissage automatique": "machine learning",
+    "ai": "artificial intelligence",
+    "ia": "artificial intelligence",
+    "intelligence artificielle": "artificial intelligence",
+    "dl": "deep learning",
+    "sklearn": "scikit-learn",
+    "powerbi": "power bi",
+    "gestion de projet": "project management",
+}
+
+_BULLET = "•"
+_PARAGRAPH_BREAK = re.compile(r"(\n[ \t]*\n\s*)")
+_HEADING = re.compile(r"^[A-ZÀ-ÖØ-Ý][A-ZÀ-ÖØ-Ý'’&/ -]{3,}(\s*\(.*\))?$")
+_ACHIEVEMENT = re.compile(r"\d")
+
+def title_category(job_title: str = "", keywords: Iterable[str] = ()) -> Optional[str]:
+    """Catégorie du poste : d'après le titre de l'offre, sinon d'après les mots-clés"""
+    title = (job_title or "").lower()
+    for category, markers, _ in TITLE_RULES:
+        if any(marker in title for marker in markers):
+            return category
+    found = {keyword.lower() for keyword in keywords}
+    for category, markers, _ in TITLE_RULES:
+        if found.intersection(markers):
+            return category
+    return None
+
+def _section_kind(heading: str) -> Optional[str]:
+    heading = fold(heading)
+    if "competence" in heading and "soft" not in heading:
+        return "skills"
+    if "experience" in heading:
+        return "experience"
+    return None
+
+class CVTemplate:
+    """CV de base pré-analysé, rendu par emplacements avec cache LRU"""
+
+    def __init__(self, text: str, adaptable_sections: Dict[str, bool] = None,
+                 adaptation_rules: Dict = None, cache_size: int = None):
+        self.text = text
+        self.sections = {**CV_CONFIG["adaptable_sections"], **(adaptable_sections or {})}
+        self.rules = {**CV_CONFIG["adaptation_rules"], **(adaptation_rules or {})}
+
+        # Blocs (tuples de lignes) et séparateurs d'origine, dans l'ordre du texte
+        self._parts: List = []
+        self._kinds: Dict[int, str] = {}  # index du bloc -> "skills" / "experience"
+        self._title_at: Optional[Tuple[int, int]] = None
+        self._parse(text)
+
+        self.render = lru_cache(maxsize=cache_size or CV_CONFIG["render_cache_size"])(self._render)
+
+    def _parse(self, text: str):
+        kind = None
+        for index, chunk in enumerate(_PARAGRAPH_BREAK.split(text)):
+            if index % 2:
+                self._parts.append(chunk)  # Séparateur conservé tel quel
+                continue
+            lines = tuple(chunk.split("\n"))
+            if self._title_at is None:
+                # Titre : ligne "A | B" de l'en-tête, sinon celle qui suit le nom
+                header = [number for number, line in enumerate(lines) if line.strip()]
+                with_bar = [number for number in header[:3] if "|" in lines[number]]
+                if with_bar or len(header) > 1:
+                    self._title_at = (len(self._parts), (with_bar or header)[0 if with_bar else 1])
+            if _HEADING.match(lines[0].strip()) and not lines[0].lstrip().startswith(_BULLET):
+                kind = _section_kind(lines[0])
+            if kind:
+                self._kinds[len(self._parts)] = kind
+            self._parts.append(lines)
+
+    def normalize_keywords(self, keywords: Iterable[str]) -> Tuple[str, ...]:
+        """Mots-clés en minuscules, synonymes fusionnés, sans doublon, limités"""
+        normalized: Dict[str, str] = {}
+        for keyword in keywords:
+            keyword = " ".join(keyword.lower().split())
+            if self.rules["synonym_replacement"]:
+                keyword = KEYWORD_SYNONYMS.get(keyword, keyword)
+            if keyword:
+                normalized.setdefault(fold(keyword), keyword)
+        return tuple(normalized.values())[:self.rules["max_keywords_per_section"]]
+
+    def adapt(self, keywords: Iterable[str], job_title: str = "", company: str = "",
+              category: str = None) -> str:
+        """CV adapté à une offre (rendu mémorisé + ligne propre à l'offre)"""
+        keywords = self.normalize_keywords(keywords)
+        if category is None:
+            category = title_category(job_title, keywords)
+        cv = self.render(category, keywords)
+        if keywords and job_title and self.sections["keywords_integration"]:
+            cv += f"\nPoste visé : {job_title} chez {company}"
+        return cv
+
+    def _bullet_order(self, lines: Tuple[str, ...], hits: List[int], kind: str) -> List[str]:
+        """Puces les plus pertinentes en premier (tri stable), le reste ne bouge pas"""
+        movable = [number for number, line in enumerate(lines) if line.lstrip().startswith(_BULLET)]
+        if kind == "experience" and self.rules["preserve_achievements"]:
+            movable = [number for number in movable if not _ACHIEVEMENT.search(lines[number])]
+        ordered = sorted(movable, key=lambda number: -hits[number])
+        result = list(lines)
+        for slot, number in zip(movable, ordered):
+            result[slot] = lines[number]
+        return result
+
+    def _render(self, category: Optional[str], keywords: Tuple[str, ...]) -> str:
+        matcher = get_matcher(keywords) if keywords else None
+        parts: List[str] = []
+        skill_blocks: List[Tuple[int, int]] = []  # (position dans parts, pertinence)
+
+        for index, part in enumerate(self._parts):
+            if isinstance(part, str):
+                parts.append(part)
+                continue
+            lines = part
+            if self._title_at and self._title_at[0] == index and category in CATEGORY_TITLES \
+                    and self.sections["title"]:
+                lines = list(lines)
+                lines[self._title_at[1]] = CATEGORY_TITLES[category]
+
+            kind = self._kinds.get(index)
+            adaptable = self.sections["skills"] if kind == "skills" else \
+                self.sections["experience_descriptions"] if kind == "experience" else False
+            if matcher and adaptable:
+                hits = [sum(matcher.counts(line).values()) for line in lines]
+                lines = self._bullet_order(lines, hits, kind)
+                if kind == "skills" and any(line.lstrip().startswith(_BULLET) for line in lines):
+                    skill_blocks.append((len(parts), sum(hits)))
+            parts.append("\n".join(lines))
+
+        if skill_blocks and not self.rules["keep_structure"]:
+            # Blocs de compétences eux-mêmes triés par pertinence
+            slots = [position for position, _ in skill_blocks]
+            blocks = [parts[position] for position, _ in sorted(skill_blocks, key=lambda block: -block[1])]
+            for position, block in zip(slots, blocks):
+                parts[position] = block
+
+        cv = "".join(parts)
+        if keywords and self.sections["keywords_integration"]:
+            cv += "\n\n🎯 COMPÉTENCES MISES EN AVANT POUR CE POSTE\n"
+            cv += f"Technologies et compétences recherchées : {', '.join(keywords)}"
+        return cv
+
+@lru_cache(maxsize=4)
+def get_template(text: str) -> CVTemplate:
+    """Modèle analysé partagé pour un texte de CV (analysé au premier appel)"""
+    return CVTemplate(text)
@@ -1,6 +1,5 @@
 import streamlit as st
 import pandas as pd
-import sqlite3
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
@@ -43,9 +42,14 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def get_database() -> JobDatabase:
+    """Instance de base partagée entre les reruns Streamlit (connexions persistantes)"""
+    return JobDatabase()
+
 class JobDashboard:
     def __init__(self):
-        self.db = JobDatabase()
+        self.db = get_database()
         self.system = None
         
         # Session state pour le statut du système
@@ -56,26 +60,17 @@ class JobDashboard:
     
     def get_stats(self):
         """Récupère les statistiques"""
-        conn = sqlite3.connect(self.db.db_path)
-        
-        # Stats générales
-        total_jobs = pd.read_sql('SELECT COUNT(*) as count FROM jobs', conn).iloc[0]['count']
-        applied_jobs = pd.read_sql('SELECT COUNT(*) as count FROM jobs WHERE status="applied"', conn).iloc[0]['count']
-        responded_jobs = pd.read_sql('SELECT COUNT(*) as count FROM jobs WHERE status="responded"', conn).iloc[0]['count']
+        # Compteurs maintenus par triggers : lectures O(1) quelle que soit la taille de la table
+        status_counts = self.db.get_status_counts()
+        total_jobs = sum(status_counts.values())
+        applied_jobs = status_counts.get('applied', 0)
+        responded_jobs = status_counts.get('responded', 0)
         
         # Jobs par statut
-        status_stats = pd.read_sql('''
-            SELECT status, COUNT(*) as count 
-            FROM jobs 
-            GROUP BY status
-        ''', conn)
+        status_stats = pd.DataFrame(list(status_counts.items()), columns=['status', 'count'])
         
         # Jobs par source
-        source_stats = pd.read_sql('''
-            SELECT source, COUNT(*) as count 
-            FROM jobs 
-            GROUP BY source
-        ''', conn)
+        source_stats = pd.DataFrame(list(self.db.get_source_counts().items()), columns=['source', 'count'])
         
         # Jobs récents
         recent_jobs = pd.read_sql('''
@@ -83,21 +78,11 @@ class JobDashboard:
             FROM jobs 
             ORDER BY date_scraped DESC 
             LIMIT 20
-        ''', conn)
+        ''', self.db.get_connection())
         
         # Évolution temporelle
-        daily_stats = pd.read_sql('''
-            SELECT 
-                DATE(date_scraped) as date,
-                COUNT(*) as jobs_scraped,
-                SUM(CASE WHEN status = 'applied' THEN 1 ELSE 0 END) as jobs_applied
-            FROM jobs 
-            WHERE date_scraped >= date('now', '-30 days')
-            GROUP BY DATE(date_scraped)
-            ORDER BY date
-        ''', conn)
-        
-        conn.close()
+        daily_stats = pd.DataFrame(self.db.get_daily_counts(days=30),
+                                   columns=['date', 'jobs_scraped', 'jobs_applied'])
         
         return {
             'total_jobs': total_jobs,
@@ -266,14 +251,22 @@ class JobDashboard:
             with col3:
                 title_filter = st.text_input("Filtrer par titre")
             
-            # Application des filtres
-            filtered_jobs = stats['recent_jobs'].copy()
-            if status_filter != 'Tous':
-                filtered_jobs = filtered_jobs[filtered_jobs['status'] == status_filter]
-            if company_filter:
-                filtered_jobs = filtered_jobs[filtered_jobs['company'].str.contains(company_filter, case=False, na=False)]
-            if title_filter:
-                filtered_jobs = filtered_jobs[filtered_jobs['title'].str.contains(title_filter, case=False, na=False)]
+            # Application des filtres : les recherches texte passent par l'index
+            # plein texte et portent sur toutes les offres, pas seulement les récentes
+            if company_filter or title_filter:
+                columns = list(stats['recent_jobs'].columns)
+                rows = self.db.search_rows(
+                    columns,
+                    status=None if status_filter == 'Tous' else status_filter,
+                    limit=100,
+                    title=title_filter,
+                    company=company_filter
+                )
+                filtered_jobs = pd.DataFrame(rows, columns=columns)
+            else:
+                filtered_jobs = stats['recent_jobs'].copy()
+                if status_filter != 'Tous':
+                    filtered_jobs = filtered_jobs[filtered_jobs['status'] == status_filter]
             
             # Affichage du tableau
             st.dataframe(
@@ -0,0 +1,121 @@
+"""
+Détection des offres en double (multi-sites, republications)
+
+Chaque offre reçoit une empreinte SimHash 64 bits calculée sur son titre,
+son entreprise et sa description normalisés : deux offres presque
+identiques ont des empreintes qui ne diffèrent que de quelques bits.
+
+L'empreinte est découpée en 6 bandes (4 de 11 bits, 2 de 10 bits) indexées
+dans SQLite. Deux empreintes à distance de Hamming <= 5 ont forcément une
+bande identique : seules les offres partageant une bande sont comparées,
+pas toute la base.
+"""
+
+import hashlib
+import re
+import unicodedata
+from collections import Counter
+from typing import Iterable, List
+
+import numpy as np
+
+from config import *
+
+BAND_BITS = (11, 11, 11, 11, 10, 10)
+_BAND_SHIFTS = [sum(BAND_BITS[:band]) for band in range(len(BAND_BITS))]
+_BITS = np.arange(64, dtype=np.uint64)
+
+def normalize_text(text: str) -> List[str]:
+    """Mots en minuscules, sans accents ni ponctuation"""
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return re.findall(r"\w+", text.lower())
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+
+def simhash(text: str) -> int:
+    """Empreinte SimHash 64 bits (non signée) des paires de mots consécutifs du texte"""
+    words = normalize_text(text)
+    features = Counter(" ".join(pair) for pair in zip(words, words[1:])) or Counter(words)
+    if not features:
+        return 0
+    hashes = np.fromiter((_feature_hash(feature) for feature in features), dtype=np.uint64, count=len(features))
+    counts = np.fromiter(features.values(), dtype=np.int64, count=len(features))
+
+    # Matrice (caractéristiques x 64 bits) : +poids si le bit est à 1, -poids sinon
+    bits = ((hashes[:, None] >> _BITS) & np.uint64(1)).astype(np.int64)
+    weights = counts @ (2 * bits - 1)
+    return int(np.packbits(weights[::-1] > 0).view(">u8")[0])
+
+def job_fingerprint(job: "JobOffer") -> int:
+    return simhash(f"{job.title} {job.company} {job.description}")
+
+def _bands(fingerprint: int) -> List[int]:
+    return [fingerprint >> shift & ((1 << width) - 1) for shift, width in zip(_BAND_SHIFTS, BAND_BITS)]
+
+def _to_signed(value: int) -> int:
+    """Les INTEGER SQLite sont signés sur 64 bits"""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+def hamming(a: int, b: int) -> int:
+    return bin((a ^ b) & 0xFFFFFFFFFFFFFFFF).count("1")
+
+class DuplicateIndex:
+    """Index persistant des empreintes, regroupe les offres en double
+
+    Une offre dont l'empreinte est proche de celle d'une offre déjà indexée
+    prend le même canonical_id et le statut 'duplicate' ; les étapes
+    suivantes (adaptation, candidature) ne traitent que les offres
+    canoniques.
+    """
+
+    def __init__(self, db: "JobDatabase", max_distance: int = None):
+        self.db = db
+        self.max_distance = max_distance if max_distance is not None else CRAWL_CONFIG["simhash_max_distance"]
+
+    def assign(self, jobs: Iterable["JobOffer"]) -> List["JobOffer"]:
+        """Indexe les offres et retourne celles qui sont canoniques (premières de leur groupe)"""
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        self.db.flush()  # Les offres doivent être en base avant d'y rattacher leur groupe
+
+        canonical = []
+        duplicates = 0
+        with self.db.transaction() as conn:
+            for job in jobs:
+                fingerprint = job_fingerprint(job)
+                bands = _bands(fingerprint)
+                candidates = conn.execute(
+                    '''
+                    SELECT f.job_id, f.simhash, IFNULL(j.canonical_id, f.job_id)
+                    FROM job_fingerprints f JOIN jobs j ON j.id = f.job_id
+                    WHERE (f.band0 = ? OR f.band1 = ? OR f.band2 = ? OR f.band3 = ? OR f.band4 = ? OR f.band5 = ?)
+                    AND f.job_id != ?
+                    ''',
+                    (*bands, job.id)
+                ).fetchall()
+
+                matches = [(hamming(fingerprint, other), canonical_id)
+                           for _, other, canonical_id in candidates
+                           if hamming(fingerprint, other) <= self.max_distance]
+                canonical_id = min(matches)[1] if matches else job.id
+
+                conn.execute(
+                    "INSERT OR REPLACE INTO job_fingerprints (job_id, simhash, band0, band1, band2, band3, band4, band5) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (job.id, _to_signed(fingerprint), *bands)
+                )
+                if canonical_id == job.id:
+                    conn.execute("UPDATE jobs SET canonical_id = ? WHERE id = ?", (job.id, job.id))
+                    canonical.append(job)
+                else:
+                    conn.execute("UPDATE jobs SET canonical_id = ?, status = 'duplicate' WHERE id = ?",
+                                 (canonical_id, job.id))
+                    job.status = "duplicate"
+                    duplicates += 1
+
+        if duplicates:
+            print(f"🧬 {duplicates} doublons regroupés ({len(canonical)} offres uniques)")
+        return canonical
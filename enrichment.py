@@ -0,0 +1,116 @@
+"""
+Enrichissement des offres : récupération des descriptions complètes
+
+Les pages de résultats ne donnent qu'un titre et une entreprise ; la
+description est lue sur la page de chaque offre. Les pages sont récupérées
+en parallèle (CrawlScheduler, délais par hôte) et les descriptions sont
+mises en cache par URL, puis revalidées par requête conditionnelle
+(ETag / Last-Modified) plutôt que téléchargées à nouveau.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from config import *
+from sites import get_site_adapter, needs_javascript
+
+def _header(headers: Dict[str, str], name: str) -> Optional[str]:
+    """Valeur d'un en-tête HTTP, sans tenir compte de la casse"""
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+class DescriptionEnricher:
+    """Complète les offres sans description, par lots, avec cache par URL"""
+
+    def __init__(self, scraper: "JobScraper", batch_size: int = None, fresh_hours: float = None):
+        self.scraper = scraper
+        self.db = scraper.db
+        self.batch_size = batch_size or CRAWL_CONFIG["enrichment_batch_size"]
+        fresh_hours = fresh_hours if fresh_hours is not None else CRAWL_CONFIG["description_cache_fresh_hours"]
+        self.fresh_for = timedelta(hours=fresh_hours)
+        self.stats = {"cache": 0, "revalidated": 0, "http": 0, "selenium": 0, "failed": 0}
+
+    def run(self, limit: int = None) -> Dict[str, str]:
+        """Récupère les descriptions manquantes ; retourne {id de l'offre: description}
+
+        Les offres dont la page n'a pas pu être chargée (erreur réseau,
+        navigateur indisponible) restent à traiter au prochain passage ; une
+        page lisible sans description (offre expirée) les retire de la file.
+        """
+        limit = limit or CRAWL_CONFIG["max_descriptions_per_cycle"]
+        pending = self.db.get_jobs_without_description(limit)
+        if not pending:
+            return {}
+
+        print(f"📖 Récupération de {len(pending)} descriptions")
+        descriptions = {}
+        batch = []
+
+        # Le cache est lu ici, dans le thread appelant : les tâches parallèles
+        # ne font que du réseau
+        items = ((job_id, url, source, self.db.get_cached_description(url))
+                 for job_id, url, source in pending)
+        for (job_id, url, _, _), entry in self.scraper.scheduler.run(items, self._fetch_description):
+            if isinstance(entry, Exception):
+                print(f"⚠️  Description {job_id}: {entry}")
+                entry = None
+            if entry is None:
+                self.stats["failed"] += 1
+                continue
+
+            self.stats[entry.pop("via")] += 1
+            entry["job_id"] = job_id
+            batch.append(entry)
+            if entry["description"]:
+                descriptions[job_id] = entry["description"]
+            if len(batch) >= self.batch_size:
+                self.db.save_descriptions(batch)
+                batch = []
+
+        self.db.save_descriptions(batch)
+        print("📖 Descriptions: " + ", ".join(f"{count} {key}" for key, count in self.stats.items() if count))
+        return descriptions
+
+    def _fetch_description(self, item: tuple) -> Optional[Dict]:
+        """Description d'une offre : cache frais, revalidation, HTTP, Selenium pour les pages dynamiques"""
+        _, url, source, cached = item
+        now = datetime.now()
+
+        if cached and cached["fetched_at"] and now - datetime.fromisoformat(str(cached["fetched_at"])) < self.fresh_for:
+            return {**cached, "url": url, "via": "cache"}
+
+        headers = {}
+        if cached and cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        result = self.scraper.fetcher.fetch(url, headers=headers or None)
+        if result.status_code == 304 and cached:
+            return {**cached, "url": url, "fetched_at": now, "via": "revalidated"}
+        if result.status_code == 0:
+            return None  # Erreur réseau : l'offre sera retentée au prochain passage
+
+        entry = {"url": url, "description": None, "etag": None, "last_modified": None,
+                 "fetched_at": now, "via": "http"}
+        adapter = get_site_adapter(source)
+        # Chrome n'est lancé que pour les pages dynamiques : une page lisible
+        # sans description (offre expirée en 404 / 410...) est enregistrée
+        # sans description, l'offre est marquée traitée
+        if adapter and (adapter.javascript_only or needs_javascript(result.text, result.status_code)):
+            description = self.scraper.get_job_description_selenium(url, source)
+            if description is None and not cached:
+                return None  # Navigateur indisponible : l'offre sera retentée au prochain passage
+            entry["description"] = description or None
+            entry["via"] = "selenium"
+        elif adapter and result.ok:
+            entry["description"] = adapter.parse_description(result.text)
+            entry["etag"] = _header(result.headers, "ETag")
+            entry["last_modified"] = _header(result.headers, "Last-Modified")
+
+        if not entry["description"] and cached:
+            return {**cached, "url": url, "via": "cache"}
+        return entry
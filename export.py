@@ -0,0 +1,116 @@
+"""
+Export de la table jobs en CSV, Excel ou Parquet
+
+Les lignes sont lues en flux (JobDatabase.iter_rows) et écrites par paquets :
+la mémoire utilisée ne dépend pas de la taille de la base.
+"""
+
+import csv
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, List
+
+from config import *
+
+# Extension des fichiers produits, par format
+EXPORT_EXTENSIONS = {
+    "csv": ".csv",
+    "excel": ".xlsx",
+    "parquet": ".parquet",
+}
+
+# Colonnes exportées par défaut (le CV adapté, volumineux, est à demander explicitement)
+DEFAULT_EXPORT_COLUMNS = [
+    "id", "title", "company", "location", "salary", "url", "source",
+    "date_scraped", "keywords", "status", "application_date"
+]
+
+def export_jobs(db: "JobDatabase", fmt: str, output: Path = None, columns: List[str] = None,
+                status: str = None, since: datetime = None, until: datetime = None,
+                chunk_size: int = None) -> Path:
+    """Exporte les offres filtrées vers un fichier et retourne son chemin"""
+    if fmt not in DATABASE_CONFIG["export_formats"]:
+        raise ValueError(f"Format d'export non supporté: {fmt} "
+                         f"(disponibles: {', '.join(DATABASE_CONFIG['export_formats'])})")
+
+    columns = list(columns or DEFAULT_EXPORT_COLUMNS)
+    chunk_size = chunk_size or DATABASE_CONFIG["export_chunk_size"]
+    if output is None:
+        output = DATABASE_CONFIG["export_dir"] / f"jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}{EXPORT_EXTENSIONS[fmt]}"
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    chunks = _iter_chunks(db, columns, status, since, until, chunk_size)
+    writers = {"csv": _write_csv, "excel": _write_excel, "parquet": _write_parquet}
+    count = writers[fmt](output, columns, chunks)
+
+    print(f"📤 {count} offres exportées vers {output}")
+    return output
+
+def _iter_chunks(db: "JobDatabase", columns: List[str], status: str, since: datetime,
+                 until: datetime, chunk_size: int) -> Iterator[List[tuple]]:
+    """Lit les lignes en flux et les regroupe par paquets de chunk_size"""
+    # Le CV adapté est stocké à part (cv_artifacts) : on lit sa référence
+    query_columns = [c if c != "cv_adapted" else "cv_hash" for c in columns]
+    cv_index = columns.index("cv_adapted") if "cv_adapted" in columns else None
+
+    rows = db.iter_rows(query_columns, status=status, since=since, until=until,
+                        order_by="date_scraped", batch_size=chunk_size)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        if cv_index is not None:
+            chunk = [row[:cv_index] + (db.load_cv(row[cv_index]) if row[cv_index] else None,) + row[cv_index + 1:]
+                     for row in chunk]
+        yield chunk
+
+def _write_csv(output: Path, columns: List[str], chunks: Iterable[List[tuple]]) -> int:
+    count = 0
+    with open(output, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for chunk in chunks:
+            writer.writerows(chunk)
+            count += len(chunk)
+    return count
+
+def _write_excel(output: Path, columns: List[str], chunks: Iterable[List[tuple]]) -> int:
+    # Mode write-only : les lignes sont écrites au fil de l'eau, pas gardées en mémoire
+    from openpyxl import Workbook
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("jobs")
+    sheet.append(columns)
+
+    count = 0
+    for chunk in chunks:
+        for row in chunk:
+            sheet.append([ILLEGAL_CHARACTERS_RE.sub("", v) if isinstance(v, str) else v for v in row])
+        count += len(chunk)
+
+    workbook.save(output)
+    return count
+
+def _write_parquet(output: Path, columns: List[str], chunks: Iterable[List[tuple]]) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("L'export Parquet nécessite pyarrow: pip install pyarrow")
+
+    # Colonnes stockées en texte : les types SQLite ne sont pas garantis par ligne
+    schema = pa.schema([(column, pa.string()) for column in columns])
+
+    count = 0
+    with pq.ParquetWriter(output, schema) as writer:
+        for chunk in chunks:
+            arrays = [
+                pa.array([None if row[i] is None else str(row[i]) for row in chunk], type=pa.string())
+                for i in range(len(columns))
+            ]
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+            count += len(chunk)
+    return count
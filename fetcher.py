@@ -0,0 +1,121 @@
+"""
+Couche HTTP du scraper : session requests partagée (keep-alive, gzip, retries)
+
+Les pages sont d'abord récupérées en HTTP simple ; le scraper ne passe par
+Selenium que pour celles qui nécessitent JavaScript.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import *
+from crawler import HostRateLimiter
+from http_cache import ResponseCache
+
+@dataclass
+class FetchResult:
+    """Réponse d'une page récupérée"""
+    url: str
+    status_code: int
+    text: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+    via: str = "http"  # "http", "cache" ou "selenium"
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 300
+
+class HttpFetcher:
+    """Client HTTP réutilisant ses connexions entre les requêtes
+
+    Chaque requête attend d'abord son tour auprès du limiteur de débit de
+    l'hôte visé (délais de politesse de SITES_CONFIG). Le cache disque des
+    réponses est consulté avant (voir http_cache.py pour les modes).
+    """
+
+    def __init__(self, session: requests.Session = None, rate_limiter: HostRateLimiter = None,
+                 cache: ResponseCache = None, cache_mode: str = None):
+        self.session = session or self._build_session()
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.cache_mode = cache_mode or HTTP_CACHE_CONFIG["mode"]
+        self.cache = None
+        if self.cache_mode != "off":
+            self.cache = cache or ResponseCache()
+
+    @property
+    def offline(self) -> bool:
+        """Mode rejeu : aucune requête réseau (ni navigateur) ne doit partir"""
+        return self.cache_mode == "replay"
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Session avec pool de connexions et retries sur erreurs transitoires"""
+        session = requests.Session()
+        retry = Retry(
+            total=HTTP_CONFIG["max_retries"],
+            backoff_factor=HTTP_CONFIG["backoff_factor"],
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "HEAD")
+        )
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_CONFIG["pool_connections"],
+            pool_maxsize=HTTP_CONFIG["pool_maxsize"],
+            max_retries=retry
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"User-Agent": SELENIUM_CONFIG["user_agent"], **HTTP_CONFIG["headers"]})
+        return session
+
+    def fetch(self, url: str, headers: Dict[str, str] = None) -> FetchResult:
+        """Récupère une page ; les erreurs réseau (et les absences du cache en rejeu) donnent un status_code 0"""
+        start = time.perf_counter()
+        if self.cache is not None and self.cache_mode in ("cache", "replay"):
+            cached = self.cache.get(url, ignore_ttl=self.offline)
+            if cached is not None:
+                status_code, text, cached_headers = cached
+                return FetchResult(url=url, status_code=status_code, text=text, headers=cached_headers,
+                                   elapsed=time.perf_counter() - start, via="cache")
+        if self.offline:
+            return FetchResult(url=url, status_code=0, text="", elapsed=time.perf_counter() - start, via="cache")
+
+        self.rate_limiter.wait(url)
+        start = time.perf_counter()
+        try:
+            response = self.session.get(url, headers=headers, timeout=HTTP_CONFIG["timeout"])
+        except requests.RequestException as e:
+            print(f"⚠️  Erreur HTTP {url}: {e}")
+            return FetchResult(url=url, status_code=0, text="", elapsed=time.perf_counter() - start)
+
+        # Sans charset dans l'en-tête, requests suppose ISO-8859-1 : les sites
+        # visés servent de l'UTF-8
+        if "charset" not in response.headers.get("Content-Type", "").lower():
+            response.encoding = "utf-8"
+
+        result = FetchResult(
+            url=url,
+            status_code=response.status_code,
+            text=response.text,
+            headers=dict(response.headers),
+            elapsed=time.perf_counter() - start
+        )
+        if result.ok:
+            self.record(url, result.text, result.status_code, result.headers)
+        return result
+
+    def record(self, url: str, text: str, status_code: int = 200, headers: Dict[str, str] = None):
+        """Enregistre une page dans le cache (y compris une page rendue par Selenium)"""
+        if self.cache is not None and not self.offline and text:
+            self.cache.put(url, status_code, text, headers)
+
+    def close(self):
+        """Ferme les connexions du pool et le cache"""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
@@ -0,0 +1,149 @@
+"""
+Cache disque des réponses HTTP (mode enregistrement / rejeu)
+
+Les corps de page sont compressés (zlib) et adressés par leur SHA-256 : une
+page identique servie sous plusieurs URL n'est stockée qu'une fois. Le
+cache est borné en taille, les réponses les moins récemment lues sont
+évincées en premier.
+
+Modes (HTTP_CACHE_CONFIG["mode"]) :
+- "off" : pas de cache ;
+- "cache" : réponse en cache si elle a moins de ttl_hours, sinon réseau ;
+- "record" : toujours le réseau, chaque réponse est enregistrée ;
+- "replay" : uniquement le cache, aucune requête n'est envoyée.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from config import *
+
+CACHE_MODES = ("off", "cache", "record", "replay")
+
+class ResponseCache:
+    """Réponses HTTP par URL, corps compressés et dédupliqués"""
+
+    def __init__(self, path: Path = None, ttl_hours: float = None, max_size_mb: float = None):
+        self.path = Path(path or HTTP_CACHE_CONFIG["path"])
+        ttl_hours = ttl_hours if ttl_hours is not None else HTTP_CACHE_CONFIG["ttl_hours"]
+        self.ttl = timedelta(hours=ttl_hours)
+        self.max_size = int((max_size_mb or HTTP_CACHE_CONFIG["max_size_mb"]) * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Une connexion partagée par les threads du crawl, protégée par un verrou
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript('''
+        CREATE TABLE IF NOT EXISTS bodies (
+            hash TEXT PRIMARY KEY,
+            body BLOB NOT NULL,
+            size INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS responses (
+            url TEXT PRIMARY KEY,
+            status_code INTEGER NOT NULL,
+            headers TEXT,
+            body_hash TEXT NOT NULL,
+            fetched_at TIMESTAMP NOT NULL,
+            accessed_at TIMESTAMP NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+        ''')
+        self._size = self._conn.execute("SELECT IFNULL(SUM(size), 0) FROM bodies").fetchone()[0]
+
+    def get(self, url: str, ignore_ttl: bool = False) -> Optional[Tuple[int, str, Dict[str, str]]]:
+        """(status_code, texte, en-têtes) de la réponse en cache, ou None si absente ou expirée"""
+        now = datetime.now()
+        with self._lock:
+            row = self._conn.execute(
+                '''
+                SELECT r.status_code, r.headers, r.fetched_at, b.body
+                FROM responses r JOIN bodies b ON b.hash = r.body_hash
+                WHERE r.url = ?
+                ''',
+                (url,)
+            ).fetchone()
+            if row is None or (not ignore_ttl and now - datetime.fromisoformat(row[2]) > self.ttl):
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url))
+            self.hits += 1
+
+        status_code, headers, _, body = row
+        return status_code, zlib.decompress(body).decode("utf-8"), json.loads(headers or "{}")
+
+    def put(self, url: str, status_code: int, text: str, headers: Dict[str, str] = None):
+        """Enregistre une réponse (le corps n'est écrit que s'il est nouveau)"""
+        data = text.encode("utf-8")
+        body_hash = hashlib.sha256(data).hexdigest()
+        now = datetime.now()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if not self._conn.execute("SELECT 1 FROM bodies WHERE hash = ?", (body_hash,)).fetchone():
+                    body = zlib.compress(data, HTTP_CACHE_CONFIG["compression_level"])
+                    self._conn.execute("INSERT INTO bodies (hash, body, size) VALUES (?, ?, ?)",
+                                       (body_hash, body, len(body)))
+                    self._size += len(body)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (url, status_code, headers, body_hash, fetched_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (url, status_code, json.dumps(headers or {}), body_hash, now, now)
+                )
+                if self._size > self.max_size:
+                    self._evict()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _evict(self):
+        """Supprime les réponses les moins récemment lues jusqu'à 90 % de max_size"""
+        target = self.max_size * 0.9
+        while self._size > target:
+            urls = [row[0] for row in self._conn.execute(
+                "SELECT url FROM responses ORDER BY accessed_at LIMIT 100"
+            )]
+            if not urls:
+                break
+            placeholders = ", ".join("?" * len(urls))
+            self._conn.execute(f"DELETE FROM responses WHERE url IN ({placeholders})", urls)
+            # Corps qui ne sont plus référencés par aucune réponse
+            freed = self._conn.execute(
+                "SELECT IFNULL(SUM(size), 0) FROM bodies WHERE hash NOT IN (SELECT body_hash FROM responses)"
+            ).fetchone()[0]
+            self._conn.execute("DELETE FROM bodies WHERE hash NOT IN (SELECT body_hash FROM responses)")
+            self._size -= freed
+
+    def iter_bodies(self, url_contains: str = "") -> Iterator[Tuple[str, str]]:
+        """(url, texte) des réponses en cache dont l'URL contient `url_contains`"""
+        with self._lock:
+            rows = self._conn.execute(
+                '''
+                SELECT r.url, b.body FROM responses r JOIN bodies b ON b.hash = r.body_hash
+                WHERE instr(r.url, ?) > 0 ORDER BY r.url
+                ''',
+                (url_contains,)
+            ).fetchall()
+        for url, body in rows:
+            yield url, zlib.decompress(body).decode("utf-8")
+
+    def stats(self) -> Dict[str, int]:
+        """Réponses en cache, taille compressée, succès et échecs de lecture"""
+        with self._lock:
+            responses = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {"responses": responses, "size": self._size, "hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -3,22 +3,32 @@ import json
 import pandas as pd
 from datetime import datetime
 import sqlite3
+import threading
+import queue
+import weakref
+import hashlib
+import zlib
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import List, Dict, Optional
-import requests
-from bs4 import BeautifulSoup
+from typing import List, Dict, Optional, Iterable, Iterator, Set
 import time
 import random
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from pathlib import Path
+from selenium.common.exceptions import WebDriverException
 import re
 
 # Import configuration
 from config import *
+from maintenance import DatabaseMaintenance
+from fetcher import HttpFetcher
+from browser_pool import BrowserPool, dismiss_cookie_banner, wait_until_ready
+from crawler import CrawlScheduler
+from cv_template import get_template
+from enrichment import DescriptionEnricher
+from dedup import DuplicateIndex
+from keyword_matcher import ProfileMatch, get_profile_matcher, matcher_for_profile
+from scoring import ScoringEngine
+from sites import SiteAdapter, enabled_sites, get_site_adapter, needs_javascript
 
 @dataclass
 class JobOffer:
@@ -35,20 +45,69 @@ class JobOffer:
     date_scraped: datetime
     keywords: List[str] = None
     status: str = "scraped"
+    cv_adapted: Optional[str] = None
 
-class JobDatabase:
-    """Gestion de la base de données des offres"""
+class _LazyField:
+    """Champ de LazyJobOffer lu en base à la première lecture s'il n'a pas été chargé"""
     
-    def __init__(self, db_path: str = None):
-        self.db_path = db_path or DATABASE_CONFIG["path"]
-        self.init_database()
+    def __set_name__(self, owner, name):
+        self.name = name
     
-    def init_database(self):
-        """Initialise la base de données"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if self.name not in obj.__dict__:
+            obj._load_missing_fields()
+        return obj.__dict__[self.name]
+    
+    def __set__(self, obj, value):
+        obj.__dict__[self.name] = value
+
+class LazyJobOffer(JobOffer):
+    """Offre issue de JobDatabase.iter_jobs : seules les colonnes demandées sont
+    chargées, les autres (description, CV adapté...) sont lues à la demande"""
+    
+    id = _LazyField()
+    title = _LazyField()
+    company = _LazyField()
+    location = _LazyField()
+    description = _LazyField()
+    requirements = _LazyField()
+    salary = _LazyField()
+    url = _LazyField()
+    source = _LazyField()
+    date_scraped = _LazyField()
+    keywords = _LazyField()
+    status = _LazyField()
+    cv_adapted = _LazyField()
+    
+    @classmethod
+    def from_row(cls, db: "JobDatabase", values: Dict) -> "LazyJobOffer":
+        """Construit une offre partielle à partir d'une ligne projetée"""
+        job = cls.__new__(cls)
+        job.__dict__["_db"] = db
+        for column, value in values.items():
+            if column == "keywords":
+                value = json.loads(value) if value else []
+            setattr(job, column, value)
+        return job
+    
+    def _load_missing_fields(self):
+        """Charge en une requête tous les champs pas encore lus"""
+        missing = [name for name in JobDatabase.JOB_COLUMNS if name not in self.__dict__]
+        values = self.__dict__["_db"].get_job_fields(self.__dict__["id"], missing)
+        for column in missing:
+            value = values.get(column)
+            if column == "keywords":
+                value = json.loads(value) if value else []
+            self.__dict__[column] = value
+
+# Migrations du schéma : (version, description, étapes). Une étape est une
+# requête SQL ou une fonction recevant la connexion. Ne jamais modifier une
+# migration déjà publiée : ajouter une nouvelle version à la fin.
+SCHEMA_MIGRATIONS = [
+    (1, "Table jobs", [
+        '''
         CREATE TABLE IF NOT EXISTS jobs (
             id TEXT PRIMARY KEY,
             title TEXT,
@@ -65,177 +124,1163 @@ class JobDatabase:
             cv_adapted TEXT,
             application_date TIMESTAMP
         )
+        ''',
+    ]),
+    (2, "Index sur status, source et date_scraped", [
+        "CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)",
+        "CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source)",
+        "CREATE INDEX IF NOT EXISTS idx_jobs_date_scraped ON jobs(date_scraped)",
+        "CREATE INDEX IF NOT EXISTS idx_jobs_status_date ON jobs(status, date_scraped)",
+    ]),
+    (3, "Stockage dédupliqué et compressé des CV adaptés", [
+        '''
+        CREATE TABLE IF NOT EXISTS cv_artifacts (
+            hash TEXT PRIMARY KEY,
+            codec TEXT NOT NULL,
+            base_hash TEXT,
+            body BLOB NOT NULL,
+            size INTEGER,
+            created_at TIMESTAMP
+        )
+        ''',
+        lambda conn: _add_column(conn, "jobs", "cv_hash", "TEXT"),
+        lambda conn: _migrate_cv_adapted_to_artifacts(conn),
+    ]),
+    (4, "Compteurs agrégés (statut, source, jour) maintenus par triggers", [
+        "CREATE TABLE IF NOT EXISTS job_counts_status (status TEXT PRIMARY KEY, count INTEGER NOT NULL DEFAULT 0)",
+        "CREATE TABLE IF NOT EXISTS job_counts_source (source TEXT PRIMARY KEY, count INTEGER NOT NULL DEFAULT 0)",
+        '''
+        CREATE TABLE IF NOT EXISTS job_counts_daily (
+            day TEXT PRIMARY KEY,
+            scraped INTEGER NOT NULL DEFAULT 0,
+            applied INTEGER NOT NULL DEFAULT 0
+        )
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS jobs_counts_insert AFTER INSERT ON jobs BEGIN
+            INSERT INTO job_counts_status (status, count) VALUES (IFNULL(NEW.status, ''), 1)
+                ON CONFLICT(status) DO UPDATE SET count = count + 1;
+            INSERT INTO job_counts_source (source, count) VALUES (IFNULL(NEW.source, ''), 1)
+                ON CONFLICT(source) DO UPDATE SET count = count + 1;
+            INSERT INTO job_counts_daily (day, scraped, applied)
+                VALUES (IFNULL(DATE(NEW.date_scraped), ''), 1, NEW.status IS 'applied')
+                ON CONFLICT(day) DO UPDATE SET scraped = scraped + 1, applied = applied + excluded.applied;
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS jobs_counts_delete AFTER DELETE ON jobs BEGIN
+            UPDATE job_counts_status SET count = count - 1 WHERE status = IFNULL(OLD.status, '');
+            UPDATE job_counts_source SET count = count - 1 WHERE source = IFNULL(OLD.source, '');
+            UPDATE job_counts_daily SET scraped = scraped - 1, applied = applied - (OLD.status IS 'applied')
+                WHERE day = IFNULL(DATE(OLD.date_scraped), '');
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS jobs_counts_update AFTER UPDATE OF status, source, date_scraped ON jobs BEGIN
+            UPDATE job_counts_status SET count = count - 1 WHERE status = IFNULL(OLD.status, '');
+            UPDATE job_counts_source SET count = count - 1 WHERE source = IFNULL(OLD.source, '');
+            UPDATE job_counts_daily SET scraped = scraped - 1, applied = applied - (OLD.status IS 'applied')
+                WHERE day = IFNULL(DATE(OLD.date_scraped), '');
+            INSERT INTO job_counts_status (status, count) VALUES (IFNULL(NEW.status, ''), 1)
+                ON CONFLICT(status) DO UPDATE SET count = count + 1;
+            INSERT INTO job_counts_source (source, count) VALUES (IFNULL(NEW.source, ''), 1)
+                ON CONFLICT(source) DO UPDATE SET count = count + 1;
+            INSERT INTO job_counts_daily (day, scraped, applied)
+                VALUES (IFNULL(DATE(NEW.date_scraped), ''), 1, NEW.status IS 'applied')
+                ON CONFLICT(day) DO UPDATE SET scraped = scraped + 1, applied = applied + excluded.applied;
+        END
+        ''',
+        lambda conn: _rebuild_job_counts(conn),
+    ]),
+    (5, "Index plein texte FTS5 (titre, entreprise, description, prérequis)", [
+        lambda conn: _create_fts_index(conn),
+    ]),
+    (6, "Cache des descriptions par URL (revalidation ETag / Last-Modified)", [
+        '''
+        CREATE TABLE IF NOT EXISTS description_cache (
+            url TEXT PRIMARY KEY,
+            description TEXT,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at TIMESTAMP
+        )
+        ''',
+        lambda conn: _add_column(conn, "jobs", "description_fetched_at", "TIMESTAMP"),
+        # Index partiel : ne contient que les offres encore sans description
+        "CREATE INDEX IF NOT EXISTS idx_jobs_description_pending ON jobs(date_scraped) WHERE description_fetched_at IS NULL",
+    ]),
+    (7, "Empreintes SimHash et regroupement des offres en double", [
+        '''
+        CREATE TABLE IF NOT EXISTS job_fingerprints (
+            job_id TEXT PRIMARY KEY,
+            simhash INTEGER NOT NULL,
+            band0 INTEGER NOT NULL,
+            band1 INTEGER NOT NULL,
+            band2 INTEGER NOT NULL,
+            band3 INTEGER NOT NULL,
+            band4 INTEGER NOT NULL,
+            band5 INTEGER NOT NULL
+        )
+        ''',
+        # Un index par bande : la recherche de candidats ne lit que les offres
+        # partageant au moins une bande avec l'empreinte cherchée
+        "CREATE INDEX IF NOT EXISTS idx_fingerprints_band0 ON job_fingerprints(band0)",
+        "CREATE INDEX IF NOT EXISTS idx_fingerprints_band1 ON job_fingerprints(band1)",
+        "CREATE INDEX IF NOT EXISTS idx_fingerprints_band2 ON job_fingerprints(band2)",
+        "CREATE INDEX IF NOT EXISTS idx_fingerprints_band3 ON job_fingerprints(band3)",
+        "CREATE INDEX IF NOT EXISTS idx_fingerprints_band4 ON job_fingerprints(band4)",
+        "CREATE INDEX IF NOT EXISTS idx_fingerprints_band5 ON job_fingerprints(band5)",
+        '''
+        CREATE TRIGGER IF NOT EXISTS jobs_fingerprint_delete AFTER DELETE ON jobs BEGIN
+            DELETE FROM job_fingerprints WHERE job_id = OLD.id;
+        END
+        ''',
+        lambda conn: _add_column(conn, "jobs", "canonical_id", "TEXT"),
+        "CREATE INDEX IF NOT EXISTS idx_jobs_canonical ON jobs(canonical_id)",
+    ]),
+    (8, "Score de pertinence TF-IDF des offres", [
+        lambda conn: _add_column(conn, "jobs", "score", "REAL"),
+        "CREATE INDEX IF NOT EXISTS idx_jobs_status_score ON jobs(status, score DESC)",
+    ]),
+    (9, "Profil de recherche le plus proche de chaque offre", [
+        lambda conn: _add_column(conn, "jobs", "profile", "TEXT"),
+    ]),
+    (10, "Fréquences documentaires du score TF-IDF (notation incrémentale)", [
+        # Terme -> nombre d'offres notées qui le contiennent ; le terme vide
+        # porte le nombre total d'offres notées
+        '''
+        CREATE TABLE IF NOT EXISTS scoring_terms (
+            term BLOB PRIMARY KEY,
+            df INTEGER NOT NULL
+        ) WITHOUT ROWID
+        ''',
+    ]),
+]
+
+# Requêtes de référence des compteurs agrégés (recalcul complet)
+_JOB_COUNTS_QUERIES = {
+    "job_counts_status": "SELECT IFNULL(status, ''), COUNT(*) FROM jobs GROUP BY 1",
+    "job_counts_source": "SELECT IFNULL(source, ''), COUNT(*) FROM jobs GROUP BY 1",
+    "job_counts_daily": "SELECT IFNULL(DATE(date_scraped), ''), COUNT(*), SUM(status IS 'applied') FROM jobs GROUP BY 1",
+}
+
+def _create_fts_index(conn: sqlite3.Connection):
+    """Crée l'index FTS5 synchronisé avec jobs (ignoré si SQLite est compilé sans FTS5)"""
+    try:
+        conn.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+            title, company, description, requirements,
+            content='jobs', content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2'
+        )
         ''')
-        
-        conn.commit()
+    except sqlite3.OperationalError as e:
+        print(f"⚠️  FTS5 indisponible ({e}) : la recherche utilisera LIKE")
+        return
+    
+    conn.execute('''
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts (rowid, title, company, description, requirements)
+            VALUES (NEW.rowid, NEW.title, NEW.company, NEW.description, NEW.requirements);
+    END
+    ''')
+    conn.execute('''
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description, requirements)
+            VALUES ('delete', OLD.rowid, OLD.title, OLD.company, OLD.description, OLD.requirements);
+    END
+    ''')
+    conn.execute('''
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, company, description, requirements ON jobs BEGIN
+        INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description, requirements)
+            VALUES ('delete', OLD.rowid, OLD.title, OLD.company, OLD.description, OLD.requirements);
+        INSERT INTO jobs_fts (rowid, title, company, description, requirements)
+            VALUES (NEW.rowid, NEW.title, NEW.company, NEW.description, NEW.requirements);
+    END
+    ''')
+    conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+
+def _fts_terms(text: str) -> str:
+    """Transforme une saisie libre en requête FTS5 sûre (mots entre guillemets, préfixes)"""
+    words = re.findall(r"\w+", text)
+    return " ".join(f'"{word}"*' for word in words)
+
+def _rebuild_job_counts(conn: sqlite3.Connection):
+    """Recalcule entièrement les tables de compteurs à partir de jobs"""
+    for table, query in _JOB_COUNTS_QUERIES.items():
+        conn.execute(f"DELETE FROM {table}")
+        conn.execute(f"INSERT INTO {table} {query}")
+
+def _add_column(conn: sqlite3.Connection, table: str, column: str, declaration: str):
+    """Ajoute une colonne si elle n'existe pas encore (ALTER TABLE idempotent)"""
+    existing = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+    if column not in existing:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+
+def _migrate_cv_adapted_to_artifacts(conn: sqlite3.Connection):
+    """Déplace les CV adaptés stockés en clair dans jobs vers cv_artifacts"""
+    rows = conn.execute(
+        "SELECT id, cv_adapted FROM jobs WHERE cv_adapted IS NOT NULL AND cv_hash IS NULL"
+    ).fetchall()
+    for job_id, cv_text in rows:
+        cv_hash = _store_cv_artifact(conn, cv_text)
+        conn.execute("UPDATE jobs SET cv_hash = ?, cv_adapted = NULL WHERE id = ?", (cv_hash, job_id))
+
+def _store_cv_artifact(conn: sqlite3.Connection, text: str, base_text: str = None) -> str:
+    """Enregistre un CV (adressé par son SHA-256) et retourne son hash
+    
+    Avec `base_text`, le corps est compressé en utilisant le template de base
+    comme dictionnaire zlib : seul l'écart avec le template coûte de la place.
+    """
+    data = text.encode("utf-8")
+    cv_hash = hashlib.sha256(data).hexdigest()
+    if conn.execute("SELECT 1 FROM cv_artifacts WHERE hash = ?", (cv_hash,)).fetchone():
+        return cv_hash
+    
+    base_hash = None
+    if base_text:
+        base_hash = _store_cv_artifact(conn, base_text)
+        compressor = zlib.compressobj(9, zdict=base_text.encode("utf-8"))
+        body = compressor.compress(data) + compressor.flush()
+        codec = "zlib+dict"
+    else:
+        body = zlib.compress(data, 9)
+        codec = "zlib"
+    
+    conn.execute(
+        "INSERT OR IGNORE INTO cv_artifacts (hash, codec, base_hash, body, size, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+        (cv_hash, codec, base_hash, body, len(data), datetime.now())
+    )
+    return cv_hash
+
+class _ThreadConnection:
+    """Connexion SQLite d'un thread, rangée dans le threading.local de la base
+    
+    Le threading.local oublie ses valeurs à la fin du thread : le support est
+    alors collecté et la connexion fermée (voir _release_connection).
+    """
+    __slots__ = ("conn", "__weakref__")
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+def _release_connection(conn: sqlite3.Connection, connections: Set[sqlite3.Connection], lock: threading.RLock):
+    """Ferme la connexion d'un thread terminé et l'oublie"""
+    with lock:
+        connections.discard(conn)
+    try:
         conn.close()
+    except sqlite3.Error:
+        pass
+
+class DatabaseWriter(threading.Thread):
+    """Thread unique d'écriture d'une JobDatabase
+    
+    Les producteurs (scraper, pipeline) déposent leurs écritures dans une file
+    et continuent sans attendre le disque ; le thread les regroupe en un seul
+    commit (group commit) toutes les `max_delay_ms` ou `max_batch` opérations.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, db: "JobDatabase", max_batch: int = None, max_delay_ms: int = None):
+        super().__init__(name="JobDatabaseWriter", daemon=True)
+        self.db = db
+        self.max_batch = max_batch or DATABASE_CONFIG["writer_max_batch"]
+        self.max_delay = (max_delay_ms or DATABASE_CONFIG["writer_max_delay_ms"]) / 1000
+        self.queue = queue.Queue(maxsize=DATABASE_CONFIG["writer_queue_size"])
+        self.committed = 0
+        self.commits = 0
+        self.errors = 0
+    
+    def submit(self, fn, *args):
+        """Ajoute une écriture à la file (bloque seulement si la file est pleine)"""
+        self.queue.put((fn, args, None))
+    
+    def flush(self, timeout: float = None) -> bool:
+        """Barrière : attend que toutes les écritures déjà soumises soient commitées"""
+        done = threading.Event()
+        self.queue.put((None, (), done))
+        return done.wait(timeout)
+    
+    def stop(self):
+        """Vide la file puis arrête le thread"""
+        self.queue.put(self._STOP)
+        self.join()
+    
+    def stats(self) -> Dict[str, int]:
+        """Profondeur de file et compteurs d'activité"""
+        return {
+            "queue_depth": self.queue.qsize(),
+            "committed": self.committed,
+            "commits": self.commits,
+            "errors": self.errors,
+        }
+    
+    def run(self):
+        stopping = False
+        while not stopping:
+            item = self.queue.get()
+            batch = []
+            deadline = time.monotonic() + self.max_delay
+            
+            # Regroupe les écritures qui arrivent pendant max_delay
+            while True:
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                if item[2] is not None or len(batch) >= self.max_batch:
+                    break  # Barrière demandée ou lot plein : on commit tout de suite
+                try:
+                    item = self.queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            
+            self._commit(batch)
+    
+    def _commit(self, batch: list):
+        """Exécute un lot d'écritures dans une seule transaction"""
+        operations = [(fn, args) for fn, args, _ in batch if fn is not None]
+        if operations:
+            try:
+                with self.db.transaction():
+                    for fn, args in operations:
+                        fn(*args)
+                self.committed += len(operations)
+                self.commits += 1
+            except Exception:
+                # Rejoue une à une pour isoler l'écriture fautive
+                for fn, args in operations:
+                    try:
+                        with self.db.transaction():
+                            fn(*args)
+                        self.committed += 1
+                        self.commits += 1
+                    except Exception as e:
+                        self.errors += 1
+                        print(f"⚠️  Erreur d'écriture en arrière-plan: {e}")
+        
+        for _, _, done in batch:
+            if done is not None:
+                done.set()
+
+class JobDatabase:
+    """Gestion de la base de données des offres
+    
+    Chaque thread dispose de sa propre connexion SQLite persistante (mode WAL),
+    ce qui permet au scraper, au pipeline et au dashboard de lire et d'écrire
+    en parallèle sans rouvrir une connexion à chaque requête.
+    """
+    
+    # Colonnes correspondant aux champs de JobOffer
+    JOB_COLUMNS = ("id", "title", "company", "location", "description", "requirements", "salary",
+                   "url", "source", "date_scraped", "keywords", "status", "cv_adapted")
+    # Colonnes indexées par jobs_fts et poids associés pour le classement bm25
+    FTS_COLUMNS = {"title": 10.0, "company": 5.0, "description": 1.0, "requirements": 1.0}
+    # Colonnes volumineuses, non chargées par défaut par iter_jobs
+    HEAVY_COLUMNS = ("description", "requirements", "cv_adapted")
+    # Colonnes de la table sans champ JobOffer équivalent
+    EXTRA_COLUMNS = ("application_date", "cv_hash", "description_fetched_at", "canonical_id", "score", "profile")
+    
+    # Une offre déjà connue (republiée, crawl complet) n'est pas remplacée :
+    # seuls les champs de la page de résultats sont mis à jour, et seulement
+    # s'ils ont changé. Statut, description enrichie, score, profil et CV
+    # sont conservés ; les triggers (FTS, compteurs) ne se déclenchent pas.
+    _INSERT_JOB_SQL = '''
+    INSERT INTO jobs 
+    (id, title, company, location, description, requirements, salary, url, source, date_scraped, keywords, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        title = excluded.title, company = excluded.company, location = excluded.location,
+        url = excluded.url, salary = IFNULL(excluded.salary, salary)
+    WHERE (title, company, location, url, salary)
+        IS NOT (excluded.title, excluded.company, excluded.location, excluded.url, IFNULL(excluded.salary, salary))
+    '''
+    
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or DATABASE_CONFIG["path"]
+        self._local = threading.local()
+        self._connections: Set[sqlite3.Connection] = set()
+        self._connections_lock = threading.RLock()  # Réentrant : un finaliseur peut s'exécuter sous le verrou
+        self._cv_bases = {}  # Templates de base décompressés, par hash
+        self._writer = None
+        self.init_database()
+    
+    def get_connection(self) -> sqlite3.Connection:
+        """Retourne la connexion persistante du thread courant (créée à la demande)
+        
+        La connexion est fermée automatiquement quand le thread se termine
+        (threads du crawl, reruns Streamlit...) : pas de fuite de descripteurs.
+        """
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=DATABASE_CONFIG["busy_timeout_ms"] / 1000,
+                isolation_level=None,  # Transactions gérées explicitement par transaction()
+                check_same_thread=False
+            )
+            self._configure_connection(conn)
+            holder = _ThreadConnection(conn)
+            with self._connections_lock:
+                self._connections.add(conn)
+            weakref.finalize(holder, _release_connection, conn, self._connections, self._connections_lock)
+            self._local.holder = holder
+        return holder.conn
+    
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """Applique les pragmas de performance à une nouvelle connexion"""
+        # Sans effet sur une base existante : ne s'applique qu'à la création du
+        # fichier (les anciennes bases sont converties par DatabaseMaintenance)
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute(f"PRAGMA journal_mode={DATABASE_CONFIG['journal_mode']}")
+        conn.execute(f"PRAGMA synchronous={DATABASE_CONFIG['synchronous']}")
+        conn.execute(f"PRAGMA cache_size=-{int(DATABASE_CONFIG['cache_size_kb'])}")
+        conn.execute(f"PRAGMA busy_timeout={int(DATABASE_CONFIG['busy_timeout_ms'])}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Les triggers de suppression (compteurs agrégés) doivent aussi se
+        # déclencher pour les lignes remplacées par INSERT OR REPLACE
+        conn.execute("PRAGMA recursive_triggers=ON")
+    
+    @contextmanager
+    def transaction(self, immediate: bool = True):
+        """Ouvre une transaction sur la connexion du thread courant
+        
+        Commit à la sortie du bloc, rollback en cas d'exception. Les appels
+        imbriqués réutilisent la transaction déjà ouverte.
+        """
+        conn = self.get_connection()
+        if conn.in_transaction:
+            yield conn
+            return
+        
+        # BEGIN IMMEDIATE prend le verrou d'écriture dès le départ : pas de
+        # "database is locked" en cours de transaction
+        conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+    
+    def start_writer(self) -> DatabaseWriter:
+        """Démarre le thread d'écriture : les écritures deviennent asynchrones"""
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = DatabaseWriter(self)
+            self._writer.start()
+        return self._writer
+    
+    def stop_writer(self):
+        """Commit les écritures en attente et arrête le thread d'écriture"""
+        if self._writer is not None:
+            self._writer.stop()
+            self._writer = None
+    
+    def flush(self, timeout: float = None) -> bool:
+        """Attend que les écritures asynchrones soumises jusqu'ici soient durables"""
+        if self._writer is None or not self._writer.is_alive():
+            return True
+        return self._writer.flush(timeout)
+    
+    def writer_stats(self) -> Dict[str, int]:
+        """Statistiques du thread d'écriture (profondeur de file incluse)"""
+        if self._writer is None:
+            return {"queue_depth": 0, "committed": 0, "commits": 0, "errors": 0}
+        return self._writer.stats()
+    
+    def _dispatch(self, fn, *args):
+        """Exécute une écriture, via le thread d'écriture s'il est actif"""
+        writer = self._writer
+        if writer is not None and writer.is_alive() and threading.current_thread() is not writer:
+            writer.submit(fn, *args)
+            return None
+        return fn(*args)
+    
+    def close(self):
+        """Ferme toutes les connexions ouvertes par cette instance"""
+        self.stop_writer()
+        with self._connections_lock:
+            for conn in list(self._connections):
+                try:
+                    conn.execute("PRAGMA optimize")  # Met à jour les statistiques des index
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+    
+    def init_database(self):
+        """Initialise la base de données (création et mise à jour du schéma)"""
+        self.migrate()
+    
+    def migrate(self) -> int:
+        """Applique les migrations de schéma manquantes
+        
+        La version courante est stockée dans PRAGMA user_version : une base
+        existante (data/jobs.db) est mise à jour en place, migration par
+        migration, chacune dans sa propre transaction.
+        """
+        version = self.get_connection().execute("PRAGMA user_version").fetchone()[0]
+        
+        for target, description, steps in SCHEMA_MIGRATIONS:
+            if target <= version:
+                continue
+            
+            with self.transaction() as conn:
+                # Relecture sous verrou : un autre processus a pu migrer entre-temps
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if target <= version:
+                    continue
+                
+                print(f"🛠️  Migration du schéma v{target}: {description}")
+                for step in steps:
+                    if callable(step):
+                        step(conn)
+                    else:
+                        conn.execute(step)
+                conn.execute(f"PRAGMA user_version = {int(target)}")
+                version = target
+        
+        return version
     
     def save_job(self, job: JobOffer):
         """Sauvegarde une offre en base"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.save_jobs([job])
+    
+    def save_jobs(self, jobs: Iterable[JobOffer], batch_size: int = None) -> int:
+        """Sauvegarde un lot d'offres dans une seule transaction
         
+        Les lignes sont insérées par paquets de `batch_size` avec executemany :
+        un seul commit (donc un seul fsync) pour tout le lot. Si le thread
+        d'écriture est actif, le lot lui est confié et la méthode rend la main
+        immédiatement.
+        """
+        rows = [self._job_to_row(job) for job in jobs]
+        self._dispatch(self._insert_rows, rows, batch_size or DATABASE_CONFIG["batch_size"])
+        return len(rows)
+    
+    def _insert_rows(self, rows: List[tuple], batch_size: int):
+        """Insère des lignes déjà converties par paquets de batch_size"""
+        with self.transaction() as conn:
+            for start in range(0, len(rows), batch_size):
+                conn.executemany(self._INSERT_JOB_SQL, rows[start:start + batch_size])
+    
+    @staticmethod
+    def _job_to_row(job: JobOffer) -> tuple:
+        """Convertit une offre en tuple de paramètres pour _INSERT_JOB_SQL"""
         keywords_str = json.dumps(job.keywords) if job.keywords else None
+        return (job.id, job.title, job.company, job.location, job.description,
+                job.requirements, job.salary, job.url, job.source, job.date_scraped, keywords_str, job.status)
+    
+    def update_job_status(self, job_id: str, status: str, cv_adapted: str = None,
+                          application_date: datetime = None, cv_base: str = None):
+        """Met à jour le statut (et le CV adapté) d'une offre
         
-        cursor.execute('''
-        INSERT OR REPLACE INTO jobs 
-        (id, title, company, location, description, requirements, salary, url, source, date_scraped, keywords, status)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (job.id, job.title, job.company, job.location, job.description, 
-              job.requirements, job.salary, job.url, job.source, job.date_scraped, keywords_str, job.status))
+        Le CV est stocké dans cv_artifacts (voir store_cv) et seul son hash
+        est référencé depuis jobs. Asynchrone si le thread d'écriture est actif.
+        """
+        self._dispatch(self._update_job_status, job_id, status, cv_adapted, application_date, cv_base)
+    
+    def _update_job_status(self, job_id: str, status: str, cv_adapted: Optional[str],
+                           application_date: Optional[datetime], cv_base: Optional[str]):
+        with self.transaction() as conn:
+            cv_hash = self.store_cv(cv_adapted, cv_base) if cv_adapted else None
+            conn.execute(
+                'UPDATE jobs SET status = ?, cv_hash = ?, cv_adapted = NULL, application_date = ? WHERE id = ?',
+                (status, cv_hash, application_date, job_id)
+            )
+    
+    def save_adaptations(self, adaptations: List[tuple], cv_base: str = None):
+        """Enregistre des CV adaptés [(id, cv, profil, mots-clés)] en une transaction
         
-        conn.commit()
-        conn.close()
+        Le statut des offres n'est pas modifié (adaptation en lot, sans candidature).
+        """
+        if adaptations:
+            self._dispatch(self._write_adaptations, adaptations, cv_base)
     
-    def get_jobs_by_status(self, status: str) -> List[JobOffer]:
-        """Récupère les offres par statut"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def _write_adaptations(self, adaptations: List[tuple], cv_base: Optional[str]):
+        with self.transaction() as conn:
+            rows = [
+                (_store_cv_artifact(conn, cv, cv_base), profile, json.dumps(keywords) if keywords else None, job_id)
+                for job_id, cv, profile, keywords in adaptations
+            ]
+            conn.executemany(
+                "UPDATE jobs SET cv_hash = ?, cv_adapted = NULL, profile = ?, keywords = ? WHERE id = ?", rows
+            )
+    
+    def store_cv(self, text: str, base_text: str = None) -> str:
+        """Enregistre un CV adapté (dédupliqué, compressé) et retourne son hash"""
+        with self.transaction() as conn:
+            return _store_cv_artifact(conn, text, base_text)
+    
+    def load_cv(self, cv_hash: str) -> Optional[str]:
+        """Relit un CV à partir de son hash"""
+        if cv_hash in self._cv_bases:
+            return self._cv_bases[cv_hash]
         
-        cursor.execute('SELECT * FROM jobs WHERE status = ?', (status,))
-        rows = cursor.fetchall()
-        conn.close()
+        row = self.get_connection().execute(
+            "SELECT codec, base_hash, body FROM cv_artifacts WHERE hash = ?", (cv_hash,)
+        ).fetchone()
+        if row is None:
+            return None
         
-        jobs = []
-        for row in rows:
-            keywords = json.loads(row[10]) if row[10] else []
-            job = JobOffer(
-                id=row[0], title=row[1], company=row[2], location=row[3],
-                description=row[4], requirements=row[5], salary=row[6],
-                url=row[7], source=row[8], date_scraped=row[9],
-                keywords=keywords, status=row[11]
+        codec, base_hash, body = row
+        if codec == "zlib+dict":
+            base_text = self.load_cv(base_hash)
+            # Les templates servent de dictionnaire à de nombreux CV : on les garde en mémoire
+            self._cv_bases[base_hash] = base_text
+            decompressor = zlib.decompressobj(zdict=base_text.encode("utf-8"))
+            data = decompressor.decompress(body) + decompressor.flush()
+        else:
+            data = zlib.decompress(body)
+        return data.decode("utf-8")
+    
+    def get_jobs_without_description(self, limit: int = None) -> List[tuple]:
+        """(id, url, source) des offres dont la description n'a pas encore été récupérée"""
+        self.flush()
+        query = '''
+        SELECT id, url, source FROM jobs
+        WHERE description_fetched_at IS NULL AND url IS NOT NULL
+        ORDER BY date_scraped DESC
+        '''
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        return self.get_connection().execute(query).fetchall()
+    
+    def get_cached_description(self, url: str) -> Optional[Dict]:
+        """Entrée du cache de descriptions pour une URL (ou None)"""
+        row = self.get_connection().execute(
+            "SELECT description, etag, last_modified, fetched_at FROM description_cache WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("description", "etag", "last_modified", "fetched_at"), row))
+    
+    def save_descriptions(self, entries: List[Dict]):
+        """Enregistre un lot de descriptions (jobs et cache) en une seule transaction
+    
+        Chaque entrée contient job_id, url, description, etag, last_modified
+        et fetched_at. Asynchrone si le thread d'écriture est actif.
+        """
+        if entries:
+            self._dispatch(self._write_descriptions, list(entries))
+    
+    def _write_descriptions(self, entries: List[Dict]):
+        now = datetime.now()
+        with self.transaction() as conn:
+            conn.executemany(
+                '''
+                INSERT INTO description_cache (url, description, etag, last_modified, fetched_at)
+                VALUES (:url, :description, :etag, :last_modified, :fetched_at)
+                ON CONFLICT(url) DO UPDATE SET
+                    description = excluded.description, etag = excluded.etag,
+                    last_modified = excluded.last_modified, fetched_at = excluded.fetched_at
+                ''',
+                [entry for entry in entries if entry["description"]]
             )
-            jobs.append(job)
-        return jobs
+            # Sans description exploitable, l'offre est marquée traitée et garde son texte provisoire
+            conn.executemany(
+                # Nouvelle description : le score est à recalculer (notation incrémentale)
+                "UPDATE jobs SET description = IFNULL(?1, description), "
+                "score = CASE WHEN ?1 IS NULL THEN score END, description_fetched_at = ?2 WHERE id = ?3",
+                [(entry["description"], now, entry["job_id"]) for entry in entries]
+            )
+    
+    def save_scores(self, scores: Dict[str, float]):
+        """Enregistre les scores de pertinence {id: score} en une transaction"""
+        if scores:
+            self._dispatch(self._write_scores, list(scores.items()))
+    
+    def _write_scores(self, items: List[tuple]):
+        with self.transaction() as conn:
+            conn.executemany("UPDATE jobs SET score = ? WHERE id = ?", [(score, job_id) for job_id, score in items])
+    
+    def get_scores(self, job_ids: Iterable[str]) -> Dict[str, float]:
+        """Scores de pertinence enregistrés {id: score} des offres déjà notées"""
+        self.flush()
+        job_ids = list(job_ids)
+        batch_size = DATABASE_CONFIG["batch_size"]
+        conn = self.get_connection()
+        scores = {}
+        for start in range(0, len(job_ids), batch_size):
+            chunk = job_ids[start:start + batch_size]
+            placeholders = ", ".join("?" * len(chunk))
+            scores.update(conn.execute(
+                f"SELECT id, score FROM jobs WHERE id IN ({placeholders}) AND score IS NOT NULL", chunk
+            ))
+        return scores
+    
+    def get_term_frequencies(self) -> Dict[bytes, int]:
+        """Fréquences documentaires enregistrées du score TF-IDF {terme: offres}"""
+        self.flush()
+        return dict(self.get_connection().execute("SELECT term, df FROM scoring_terms"))
+    
+    def save_term_frequencies(self, frequencies: Dict[bytes, int], replace: bool = False):
+        """Enregistre des fréquences documentaires en une transaction
+        
+        `replace` : la table entière est remplacée (recalcul complet).
+        """
+        if frequencies or replace:
+            self._dispatch(self._write_term_frequencies, list(frequencies.items()), replace)
+    
+    def _write_term_frequencies(self, items: List[tuple], replace: bool):
+        with self.transaction() as conn:
+            if replace:
+                conn.execute("DELETE FROM scoring_terms")
+            conn.executemany(
+                "INSERT INTO scoring_terms (term, df) VALUES (?, ?) ON CONFLICT(term) DO UPDATE SET df = excluded.df",
+                items
+            )
+    
+    def save_profiles(self, profiles: Dict[str, str]):
+        """Enregistre le profil retenu {id: profil} de chaque offre en une transaction"""
+        if profiles:
+            self._dispatch(self._write_profiles, list(profiles.items()))
+    
+    def _write_profiles(self, items: List[tuple]):
+        with self.transaction() as conn:
+            conn.executemany("UPDATE jobs SET profile = ? WHERE id = ?", [(profile, job_id) for job_id, profile in items])
+    
+    def get_known_ids(self, source: str = None) -> Set[str]:
+        """Identifiants des offres déjà en base (pour le crawl incrémental)"""
+        self.flush()
+        conn = self.get_connection()
+        if source is None:
+            cursor = conn.execute("SELECT id FROM jobs")
+        else:
+            cursor = conn.execute("SELECT id FROM jobs WHERE source = ?", (source,))
+        return {row[0] for row in cursor}
+    
+    def get_status_counts(self) -> Dict[str, int]:
+        """Nombre d'offres par statut (lecture des compteurs agrégés)"""
+        rows = self.get_connection().execute(
+            "SELECT status, count FROM job_counts_status WHERE count > 0 ORDER BY status"
+        )
+        return dict(rows.fetchall())
+    
+    def get_source_counts(self) -> Dict[str, int]:
+        """Nombre d'offres par source (lecture des compteurs agrégés)"""
+        rows = self.get_connection().execute(
+            "SELECT source, count FROM job_counts_source WHERE count > 0 ORDER BY source"
+        )
+        return dict(rows.fetchall())
+    
+    def get_daily_counts(self, days: int = 30) -> List[tuple]:
+        """Offres scrapées et candidatures par jour sur les `days` derniers jours"""
+        rows = self.get_connection().execute(
+            "SELECT day, scraped, applied FROM job_counts_daily "
+            "WHERE day >= date('now', ?) AND scraped > 0 ORDER BY day",
+            (f"-{int(days)} days",)
+        )
+        return rows.fetchall()
+    
+    def check_stats(self) -> Dict[str, List[tuple]]:
+        """Compare les compteurs agrégés à un recalcul complet
+        
+        Retourne, par table, les lignes qui diffèrent (vide si tout est cohérent).
+        """
+        conn = self.get_connection()
+        differences = {}
+        for table, query in _JOB_COUNTS_QUERIES.items():
+            expected = {row[0]: row[1:] for row in conn.execute(query)}
+            stored = {row[0]: row[1:] for row in conn.execute(f"SELECT * FROM {table}")
+                      if any(row[1:])}
+            diff = [(key, stored.get(key), expected.get(key))
+                    for key in sorted(set(expected) | set(stored))
+                    if stored.get(key) != expected.get(key)]
+            if diff:
+                differences[table] = diff
+        return differences
+    
+    def rebuild_stats(self):
+        """Recalcule entièrement les compteurs agrégés"""
+        with self.transaction() as conn:
+            _rebuild_job_counts(conn)
+    
+    def get_jobs_by_status(self, status: str) -> List[JobOffer]:
+        """Récupère les offres par statut (champs lourds chargés à la demande)"""
+        return list(self.iter_jobs(status=status))
+    
+    def iter_rows(self, columns: Iterable[str], status: str = None, order_by: str = None,
+                  batch_size: int = None, since: datetime = None, until: datetime = None,
+                  unscored: bool = False) -> Iterator[tuple]:
+        """Parcourt la table jobs en flux (fetchmany) sur les colonnes demandées
+        
+        `since` / `until` filtrent sur date_scraped (bornes incluse / exclue) ;
+        `unscored` : seulement les offres sans score de pertinence.
+        """
+        columns = self._check_columns(columns)
+        batch_size = batch_size or DATABASE_CONFIG["batch_size"]
+        
+        query = f"SELECT {', '.join(columns)} FROM jobs"
+        conditions, params = [], []
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status)
+        if since is not None:
+            conditions.append("date_scraped >= ?")
+            params.append(since.isoformat(" "))
+        if until is not None:
+            conditions.append("date_scraped < ?")
+            params.append(until.isoformat(" "))
+        if unscored:
+            conditions.append("score IS NULL")
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        if order_by is not None:
+            column, _, direction = order_by.partition(" ")
+            self._check_columns([column])
+            if direction.upper() not in ("", "ASC", "DESC"):
+                raise ValueError(f"Ordre de tri invalide: {order_by}")
+            query += f" ORDER BY {column} {direction.upper()}"
+        
+        cursor = self.get_connection().execute(query, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+    
+    def iter_jobs(self, status: str = None, columns: Iterable[str] = None, order_by: str = None,
+                  batch_size: int = None) -> Iterator[LazyJobOffer]:
+        """Parcourt les offres en flux sans tout charger en mémoire
+        
+        Par défaut seules les colonnes légères sont lues ; les colonnes non
+        sélectionnées (description, requirements, cv_adapted...) sont chargées
+        à la première lecture de l'attribut correspondant.
+        """
+        if columns is None:
+            columns = [c for c in self.JOB_COLUMNS if c not in self.HEAVY_COLUMNS]
+        columns = self._check_columns(columns)
+        if "id" not in columns:
+            columns = ["id"] + columns
+        
+        if "cv_adapted" in columns and "cv_hash" not in columns:
+            columns = columns + ["cv_hash"]
+        
+        for row in self.iter_rows(columns, status=status, order_by=order_by, batch_size=batch_size):
+            yield LazyJobOffer.from_row(self, self._resolve_cv(dict(zip(columns, row))))
+    
+    def search_rows(self, columns: Iterable[str], query: str = None, status: str = None,
+                    limit: int = 50, **fields: str) -> List[tuple]:
+        """Recherche plein texte classée par pertinence (bm25)
+        
+        `query` porte sur toutes les colonnes indexées ; les arguments nommés
+        (title=..., company=...) restreignent un terme à une colonne. Tous les
+        critères doivent correspondre.
+        """
+        columns = self._check_columns(columns)
+        unknown = [f for f in fields if f not in self.FTS_COLUMNS]
+        if unknown:
+            raise ValueError(f"Colonnes non indexées: {', '.join(unknown)}")
+        
+        criteria = []
+        if query and _fts_terms(query):
+            criteria.append(_fts_terms(query))
+        for field, value in fields.items():
+            terms = _fts_terms(value or "")
+            if terms:
+                criteria.append(f"{field} : ({terms})")
+        if not criteria:
+            return []
+        
+        conn = self.get_connection()
+        selected = ", ".join(f"jobs.{c}" for c in columns)
+        
+        if self._has_fts():
+            weights = ", ".join(str(w) for w in self.FTS_COLUMNS.values())
+            sql = (f"SELECT {selected} FROM jobs_fts JOIN jobs ON jobs.rowid = jobs_fts.rowid "
+                   f"WHERE jobs_fts MATCH ?")
+            params = [" AND ".join(criteria)]
+            if status is not None:
+                sql += " AND jobs.status = ?"
+                params.append(status)
+            sql += f" ORDER BY bm25(jobs_fts, {weights}) LIMIT ?"
+        else:
+            # Repli sans FTS5 : parcours complet avec LIKE (pas de classement)
+            conditions, params = [], []
+            for field, value in [(None, query)] + list(fields.items()):
+                for word in re.findall(r"\w+", value or ""):
+                    targets = [field] if field else list(self.FTS_COLUMNS)
+                    conditions.append("(" + " OR ".join(f"jobs.{t} LIKE ?" for t in targets) + ")")
+                    params += [f"%{word}%"] * len(targets)
+            if status is not None:
+                conditions.append("jobs.status = ?")
+                params.append(status)
+            sql = f"SELECT {selected} FROM jobs WHERE {' AND '.join(conditions)} LIMIT ?"
+        
+        params.append(int(limit))
+        return conn.execute(sql, params).fetchall()
+    
+    def search(self, query: str = None, status: str = None, limit: int = 50,
+               columns: Iterable[str] = None, **fields: str) -> List[LazyJobOffer]:
+        """Recherche plein texte retournant des offres (voir search_rows)"""
+        if columns is None:
+            columns = [c for c in self.JOB_COLUMNS if c not in self.HEAVY_COLUMNS]
+        columns = self._check_columns(columns)
+        if "id" not in columns:
+            columns = ["id"] + columns
+        if "cv_adapted" in columns and "cv_hash" not in columns:
+            columns = columns + ["cv_hash"]
+        rows = self.search_rows(columns, query=query, status=status, limit=limit, **fields)
+        return [LazyJobOffer.from_row(self, self._resolve_cv(dict(zip(columns, row)))) for row in rows]
+    
+    def _has_fts(self) -> bool:
+        """Indique si l'index jobs_fts existe dans cette base"""
+        if not hasattr(self, "_fts_available"):
+            self._fts_available = self.get_connection().execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'"
+            ).fetchone() is not None
+        return self._fts_available
+    
+    def get_job_fields(self, job_id: str, columns: Iterable[str]) -> Dict:
+        """Lit quelques colonnes d'une offre (chargement paresseux)"""
+        columns = self._check_columns(columns)
+        if not columns:
+            return {}
+        if "cv_adapted" in columns and "cv_hash" not in columns:
+            columns = columns + ["cv_hash"]
+        row = self.get_connection().execute(
+            f"SELECT {', '.join(columns)} FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        return self._resolve_cv(dict(zip(columns, row))) if row else {}
+    
+    def _resolve_cv(self, values: Dict) -> Dict:
+        """Complète cv_adapted à partir de la référence cv_hash"""
+        if "cv_adapted" in values and values["cv_adapted"] is None and values.get("cv_hash"):
+            values["cv_adapted"] = self.load_cv(values["cv_hash"])
+        return values
+    
+    def _check_columns(self, columns: Iterable[str]) -> List[str]:
+        """Valide une liste de colonnes (elles sont interpolées dans le SQL)"""
+        columns = list(columns)
+        unknown = [c for c in columns if c not in self.JOB_COLUMNS and c not in self.EXTRA_COLUMNS]
+        if unknown:
+            raise ValueError(f"Colonnes inconnues: {', '.join(unknown)}")
+        return columns
 
 class JobScraper:
-    """Scraper pour différentes plateformes d'emploi"""
+    """Scraper pour différentes plateformes d'emploi
     
-    def __init__(self):
-        self.setup_driver()
-        self.db = JobDatabase()
+    Les pages sont récupérées en HTTP simple (HttpFetcher) ; Chrome n'est
+    démarré que si une page nécessite JavaScript.
+    """
+    
+    def __init__(self, db: JobDatabase = None, fetcher: HttpFetcher = None,
+                 browser_pool: BrowserPool = None):
+        self.db = db or JobDatabase()
+        self.fetcher = fetcher or HttpFetcher()
+        # Pool partagé si fourni ; sinon pool propre, fermé par close()
+        self._owns_browser_pool = browser_pool is None
+        self.browser_pool = browser_pool or BrowserPool()
+        # Pages récupérées en parallèle, au rythme autorisé pour chaque hôte
+        self.scheduler = CrawlScheduler()
+        self.pages_fetched = {"http": 0, "selenium": 0}
+        self._stats_lock = threading.Lock()
     
-    def setup_driver(self):
-        """Configure le driver Selenium"""
-        chrome_options = Options()
-        if SELENIUM_CONFIG["headless"]:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument(f"--user-agent={SELENIUM_CONFIG['user_agent']}")
+    def scrape_all(self, keywords: str, location: str = "France", max_pages: int = 5,
+                   incremental: bool = None) -> List[JobOffer]:
+        """Scrape en parallèle tous les sites activés dans SITES_CONFIG
         
-        try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.set_window_size(*SELENIUM_CONFIG["window_size"])
-        except Exception as e:
-            print(f"❌ Erreur configuration Chrome: {e}")
-            print("📝 Installez ChromeDriver: https://chromedriver.chromium.org/")
-            raise
+        Chaque site est parcouru dans son propre thread (et à son propre
+        rythme) : la durée totale est celle du site le plus lent. Les offres
+        sont fusionnées dans l'ordre de priorité des sites.
+        """
+        sites = enabled_sites()
+        if not sites:
+            print("❌ Aucun site activé dans SITES_CONFIG")
+            return []
+        
+        by_site = {}
+        fan_out = CrawlScheduler(max_workers=len(sites))
+        for adapter, jobs in fan_out.run(
+                sites, lambda adapter: self.scrape_site(adapter, keywords, location, max_pages, incremental)):
+            if isinstance(jobs, Exception):
+                print(f"❌ Erreur {adapter.name}: {jobs}")
+                jobs = []
+            by_site[adapter.name] = jobs
+        
+        merged = [job for adapter in sites for job in by_site.get(adapter.name, [])]
+        print(f"🎉 {len(merged)} offres récupérées sur {len(sites)} sites "
+              f"({self.pages_fetched['http']} pages HTTP, {self.pages_fetched['selenium']} via Selenium)")
+        return merged
+    
+    def scrape_indeed(self, keywords: str, location: str = "France", max_pages: int = 5,
+                      incremental: bool = None):
+        """Scrape Indeed (pages récupérées en parallèle)"""
+        return self.scrape_site(get_site_adapter("indeed"), keywords, location, max_pages, incremental)
     
-    def scrape_indeed(self, keywords: str, location: str = "France", max_pages: int = 5):
-        """Scrape Indeed"""
+    def scrape_site(self, adapter: SiteAdapter, keywords: str, location: str = "France", max_pages: int = 5,
+                    incremental: bool = None) -> List[JobOffer]:
+        """Scrape un site (pages récupérées en parallèle)
+        
+        En mode incrémental, les offres déjà en base sont ignorées et la
+        pagination s'arrête dès qu'une page est majoritairement déjà connue.
+        """
+        if incremental is None:
+            incremental = CRAWL_CONFIG["incremental"]
         jobs = []
-        base_url = f"https://fr.indeed.com/jobs?q={keywords.replace(' ', '+')}&l={location.replace(' ', '+')}"
+        known_ids = self.db.get_known_ids(source=adapter.name) if incremental else set()
+        skipped = 0
+        stop_at = [max_pages]  # Dernière page à traiter, abaissée en mode incrémental
         
-        print(f"🔍 Scraping Indeed: {keywords} à {location}")
+        print(f"🔍 Scraping {adapter.name}: {keywords} à {location}")
         
-        for page in range(max_pages):
-            try:
-                url = f"{base_url}&start={page * 10}"
-                print(f"📄 Page {page + 1}/{max_pages}")
-                
-                self.driver.get(url)
-                time.sleep(random.uniform(2, 4))
-                
-                # Accepter les cookies si nécessaire
-                try:
-                    cookie_button = self.driver.find_element(By.ID, "onetrust-accept-btn-handler")
-                    cookie_button.click()
-                    time.sleep(1)
-                except:
-                    pass
-                
-                # Récupérer les offres
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, "[data-jk]")
-                
-                for card in job_cards[:5]:  # Limite pour éviter la détection
-                    try:
-                        job_id = card.get_attribute("data-jk")
-                        
-                        # Titre
-                        title_elem = card.find_element(By.CSS_SELECTOR, "h2 a span")
-                        title = title_elem.text.strip()
-                        
-                        # Entreprise
-                        try:
-                            company = card.find_element(By.CSS_SELECTOR, "[data-testid='company-name']").text.strip()
-                        except:
-                            company = "Non spécifié"
-                        
-                        # Localisation
-                        try:
-                            location_elem = card.find_element(By.CSS_SELECTOR, "[data-testid='job-location']").text.strip()
-                        except:
-                            location_elem = location
-                        
-                        # URL de l'offre
-                        job_url = f"https://fr.indeed.com/viewjob?jk={job_id}"
-                        
-                        # Description (récupérée plus tard pour éviter les timeouts)
-                        description = f"Offre {title} chez {company}"
-                        
-                        job = JobOffer(
-                            id=f"indeed_{job_id}",
-                            title=title,
-                            company=company,
-                            location=location_elem,
-                            description=description,
-                            requirements="",
-                            salary=None,
-                            url=job_url,
-                            source="indeed",
-                            date_scraped=datetime.now()
-                        )
-                        
-                        jobs.append(job)
-                        self.db.save_job(job)
-                        print(f"✅ {title} - {company}")
-                        
-                    except Exception as e:
-                        print(f"⚠️  Erreur scraping job: {e}")
-                        continue
-                
-                # Pause entre pages
-                time.sleep(random.uniform(3, 6))
-                
-            except Exception as e:
-                print(f"❌ Erreur page {page + 1}: {e}")
+        def page_urls():
+            for page in range(max_pages):
+                if page > stop_at[0]:
+                    return
+                yield adapter.listing_url(keywords, location, page)
+        
+        pages = {adapter.listing_url(keywords, location, page): page for page in range(max_pages)}
+        for url, cards in self.scheduler.run(page_urls(), lambda url: self._fetch_cards(adapter, url)):
+            page = pages[url]
+            if page > stop_at[0]:
+                continue  # Page lancée avant la décision d'arrêt
+            if isinstance(cards, Exception):
+                print(f"❌ Erreur {adapter.name} page {page + 1}: {cards}")
                 continue
+            
+            print(f"📄 {adapter.name} page {page + 1}/{max_pages}")
+            
+            # Offres de la page, sauvegardées en un seul lot
+            page_jobs = []
+            for card in cards:
+                if f"{adapter.name}_{card['id']}" in known_ids:
+                    skipped += 1
+                    continue
+                job = self._card_to_job(adapter, card, location)
+                known_ids.add(job.id)
+                page_jobs.append(job)
+                print(f"✅ {job.title} - {job.company}")
+            
+            if page_jobs:
+                self.db.save_jobs(page_jobs)
+                jobs.extend(page_jobs)
+            
+            known_ratio = 1 - len(page_jobs) / len(cards) if cards else 1
+            if incremental and known_ratio >= CRAWL_CONFIG["stop_when_known_ratio"] and page < stop_at[0]:
+                print(f"⏹️  {adapter.name} page {page + 1} déjà connue à {known_ratio:.0%} : arrêt de la pagination")
+                stop_at[0] = page
         
-        print(f"🎉 Indeed: {len(jobs)} offres récupérées")
+        if skipped:
+            print(f"⏭️  {adapter.name}: {skipped} offres déjà connues ignorées")
+        print(f"📦 {adapter.name}: {len(jobs)} offres récupérées")
         return jobs
     
-    def get_job_description(self, job_url: str) -> str:
+    def _fetch_cards(self, adapter: SiteAdapter, url: str) -> List[Dict]:
+        """Récupère les cartes d'une page : HTTP d'abord, Selenium si la page a besoin de JavaScript"""
+        result = self.fetcher.fetch(url)
+        cards = []
+        via = "http"
+        # Une page HTTP lisible sans carte (aucun résultat, fin de pagination)
+        # est une vraie réponse : Chrome n'est lancé que pour les pages dynamiques
+        if adapter.javascript_only or needs_javascript(result.text, result.status_code):
+            if not self.fetcher.offline:
+                print(f"🌐 Page dynamique ({adapter.name}) : passage par Selenium")
+                cards = self._scrape_cards_selenium(adapter, url)
+                via = "selenium"
+        elif result.ok:
+            cards = adapter.parse_listing(result.text)
+        
+        with self._stats_lock:
+            self.pages_fetched[via] += 1
+        return cards
+    
+    def _scrape_cards_selenium(self, adapter: SiteAdapter, url: str) -> List[Dict]:
+        """Récupère les cartes d'une page de résultats avec le navigateur"""
+        with self.browser_pool.browser() as driver:
+            return self._read_cards(driver, adapter, url)
+    
+    def _read_cards(self, driver, adapter: SiteAdapter, url: str) -> List[Dict]:
+        """Charge une page de résultats dans le navigateur et lit ses cartes"""
+        self.fetcher.rate_limiter.wait(url)
+        with self.browser_pool.timed("listing"):
+            driver.get(url)
+            # Prête dès que la première carte est dans le DOM (pas de pause fixe)
+            wait_until_ready(driver, adapter.listing_ready)
+            if adapter.cookie_button_id:
+                dismiss_cookie_banner(driver, adapter.cookie_button_id)
+        
+        # Une seule lecture du DOM, analysée localement (pas un aller-retour
+        # chromedriver par champ) ; la page rendue est gardée pour le rejeu
+        html = driver.page_source
+        self.fetcher.record(url, html)
+        return adapter.parse_listing(html)
+    
+    @staticmethod
+    def _card_to_job(adapter: SiteAdapter, card: Dict, location: str) -> JobOffer:
+        """Construit une JobOffer à partir d'une carte extraite"""
+        company = card.get("company") or "Non spécifié"
+        return JobOffer(
+            id=f"{adapter.name}_{card['id']}",
+            title=card["title"],
+            company=company,
+            location=card.get("location") or location,
+            # Description (récupérée plus tard pour éviter les timeouts)
+            description=f"Offre {card['title']} chez {company}",
+            requirements="",
+            salary=None,
+            url=card["url"],
+            source=adapter.name,
+            date_scraped=datetime.now()
+        )
+    
+    def get_job_description(self, job_url: str, source: str = "indeed") -> str:
         """Récupère la description complète d'une offre"""
+        adapter = get_site_adapter(source)
+        result = self.fetcher.fetch(job_url)
+        # Selenium seulement pour les pages dynamiques (pas pour une offre expirée lisible)
+        if adapter and (adapter.javascript_only or needs_javascript(result.text, result.status_code)):
+            return self.get_job_description_selenium(job_url, source) or "Description non disponible"
+        if adapter and result.ok:
+            return adapter.parse_description(result.text) or "Description non disponible"
+        return "Description non disponible"
+    
+    def get_job_description_selenium(self, job_url: str, source: str = "indeed") -> Optional[str]:
+        """Récupère la description d'une offre avec le navigateur
+        
+        Retourne "" si la page a été chargée sans description exploitable, et
+        None si le navigateur n'a pas pu servir (mode hors ligne, Chrome absent
+        ou planté) : l'échec est alors passager.
+        """
+        adapter = get_site_adapter(source)
+        if adapter is None:
+            return ""
+        if self.fetcher.offline:
+            return None
         try:
-            self.driver.get(job_url)
-            time.sleep(2)
-            
-            description_elem = self.driver.find_element(By.ID, "jobDescriptionText")
-            return description_elem.text
-        except:
-            return "Description non disponible"
+            with self.browser_pool.browser() as driver:
+                self.fetcher.rate_limiter.wait(job_url)
+                with self.browser_pool.timed("description"):
+                    driver.get(job_url)
+                    wait_until_ready(driver, adapter.description_ready)
+    
+                html = driver.page_source
+                self.fetcher.record(job_url, html)
+                return adapter.parse_description(html) or ""
+        except WebDriverException as e:
+            print(f"⚠️  Navigateur indisponible pour {job_url}: {e.msg or e.__class__.__name__}")
+            return None
     
     def close(self):
-        """Ferme le driver"""
-        if hasattr(self, 'driver'):
-            self.driver.quit()
+        """Ferme les navigateurs (si le pool est propre au scraper) et les connexions HTTP"""
+        if self._owns_browser_pool:
+            self.browser_pool.close()
+        self.fetcher.close()
 
 class CVAdapterFree:
     """Adapteur de CV GRATUIT (sans IA)"""
     
-    def __init__(self):
-        self.base_cv = self.load_base_cv()
+    def __init__(self, base_cv: str = None):
+        self.base_cv = base_cv if base_cv is not None else self.load_base_cv()
+        self.template = get_template(self.base_cv)
     
     def load_base_cv(self) -> str:
         """Charge le CV de base depuis un fichier"""
@@ -247,71 +1292,51 @@ class CVAdapterFree:
             print(f"⚠️  Template CV non trouvé: {cv_path}")
             return "CV non disponible"
     
-    def extract_keywords_from_job(self, job: JobOffer, profile_config: dict) -> List[str]:
+    def extract_keywords_from_job(self, job: JobOffer, profile_config: dict,
+                                  match: ProfileMatch = None) -> List[str]:
         """Extrait les mots-clés importants d'une offre (version gratuite)"""
-        text = f"{job.title} {job.description}".lower()
-        target_keywords = profile_config.get("target_keywords", [])
-        
-        found_keywords = []
-        for keyword in target_keywords:
-            if keyword.lower() in text:
-                found_keywords.append(keyword)
+        if match is not None:
+            # Offre déjà évaluée pour tous les profils : pas de nouveau passage
+            found_keywords = list(match.keywords)
+        else:
+            # Un seul passage sur le texte pour tous les mots-clés du profil
+            found_keywords = matcher_for_profile(profile_config).find_all(f"{job.title} {job.description}")
         
         # Ajouter quelques mots-clés du titre et de la description
+        seen = {keyword.lower() for keyword in found_keywords}
         title_words = re.findall(r'\b[a-zA-Z]{4,}\b', job.title.lower())
         for word in title_words:
-            if word not in [k.lower() for k in found_keywords] and len(word) > 4:
+            if word not in seen and len(word) > 4:
                 found_keywords.append(word)
+                seen.add(word)
         
         return found_keywords[:10]  # Max 10 mots-clés
     
-    def adapt_cv_for_job(self, job: JobOffer, profile_config: dict) -> str:
-        """Adapte le CV pour une offre spécifique (version gratuite)"""
-        keywords = self.extract_keywords_from_job(job, profile_config)
-        job.keywords = keywords
-        
-        adapted_cv = self.base_cv
+    def adapt_cv_for_job(self, job: JobOffer, profile_config: dict, match: ProfileMatch = None) -> str:
+        """Adapte le CV pour une offre spécifique (version gratuite)
         
-        # Adaptation du titre selon le profil
-        if any(k.lower() in job.title.lower() for k in ["data scientist", "scientist"]):
-            adapted_cv = adapted_cv.replace(
-                "CDI DATA & IA | SCRUM MASTER & GESTION DE PROJET AGILE",
-                "DATA SCIENTIST | MACHINE LEARNING & INTELLIGENCE ARTIFICIELLE"
-            )
-        elif any(k.lower() in job.title.lower() for k in ["scrum", "agile", "project manager"]):
-            adapted_cv = adapted_cv.replace(
-                "CDI DATA & IA | SCRUM MASTER & GESTION DE PROJET AGILE",
-                "SCRUM MASTER | GESTION DE PROJET AGILE & TRANSFORMATION DIGITALE"
-            )
-        elif any(k.lower() in job.title.lower() for k in ["data analyst", "analyst"]):
-            adapted_cv = adapted_cv.replace(
-                "CDI DATA & IA | SCRUM MASTER & GESTION DE PROJET AGILE",
-                "DATA ANALYST | BUSINESS INTELLIGENCE & VISUALISATION DE DONNÉES"
-            )
-        
-        # Ajouter une section avec les mots-clés identifiés
-        if keywords:
-            keywords_section = f"\n\n🎯 COMPÉTENCES MISES EN AVANT POUR CE POSTE\n"
-            keywords_section += f"Technologies et compétences recherchées : {', '.join(keywords[:8])}\n"
-            keywords_section += f"Poste visé : {job.title} chez {job.company}"
-            adapted_cv += keywords_section
+        `match` (voir ProfileMatcher) : le profil le plus proche de l'offre
+        choisit le titre du CV s'il est nommé dans le titre de l'offre ou
+        assez de ses mots-clés sont trouvés (CV_CONFIG["profile_title_min_score"]),
+        sinon le titre de l'offre.
+        """
+        keywords = self.extract_keywords_from_job(job, profile_config, match)
+        job.keywords = keywords
         
-        return adapted_cv
+        # Modèle analysé une fois ; rendu mémorisé par (catégorie, mots-clés)
+        category = None
+        if match is not None and match.score >= min(1.0, CV_CONFIG["profile_title_min_score"]):
+            category = match.profile
+        return self.template.adapt(keywords, job_title=job.title, company=job.company, category=category)
 
 class ApplicationBot:
     """Bot de candidature automatique (version simplifiée)"""
     
-    def __init__(self):
-        self.setup_driver()
-        self.db = JobDatabase()
-    
-    def setup_driver(self):
-        """Configure le driver pour les candidatures"""
-        chrome_options = Options()
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument(f"--user-agent={SELENIUM_CONFIG['user_agent']}")
-        self.driver = webdriver.Chrome(options=chrome_options)
+    def __init__(self, db: JobDatabase = None, browser_pool: BrowserPool = None):
+        self.db = db or JobDatabase()
+        # Aucun navigateur n'est démarré tant qu'une candidature n'en a pas besoin
+        self._owns_browser_pool = browser_pool is None
+        self.browser_pool = browser_pool or BrowserPool()
     
     def apply_to_job(self, job: JobOffer, adapted_cv: str) -> bool:
         """Simule une candidature (version démo)"""
@@ -331,21 +1356,32 @@ class ApplicationBot:
         return success
     
     def close(self):
-        """Ferme le driver"""
-        if hasattr(self, 'driver'):
-            self.driver.quit()
+        """Ferme les navigateurs si le pool est propre au bot"""
+        if self._owns_browser_pool:
+            self.browser_pool.close()
 
 class JobAutomationSystem:
     """Système principal (version gratuite)"""
     
     def __init__(self):
         print("🚀 Initialisation du système de candidature automatique (Version GRATUITE)")
-        self.scraper = JobScraper()
-        self.cv_adapter = CVAdapterFree()
-        self.application_bot = ApplicationBot()
+        # Une seule instance (et donc un seul pool de connexions) partagée ;
+        # les écritures passent par son thread d'écriture
         self.db = JobDatabase()
+        if DATABASE_CONFIG["async_writes"]:
+            self.db.start_writer()
+        # Pool de navigateurs commun, démarrés seulement si une page l'exige
+        self.browser_pool = BrowserPool()
+        self.scraper = JobScraper(self.db, browser_pool=self.browser_pool)
+        self.enricher = DescriptionEnricher(self.scraper)
+        self.duplicates = DuplicateIndex(self.db)
+        self.cv_adapter = CVAdapterFree()
+        self.application_bot = ApplicationBot(self.db, browser_pool=self.browser_pool)
+        self.scoring = ScoringEngine(self.db, base_cv=self.cv_adapter.base_cv)
+        self.profile_matcher = get_profile_matcher(SEARCH_PROFILES)
     
-    def run_full_cycle(self, search_keywords: str, location: str = "France", dry_run: bool = True):
+    def run_full_cycle(self, search_keywords: str, location: str = "France", dry_run: bool = True,
+                       maintenance: bool = True):
         """Lance un cycle complet (version gratuite)"""
         print(f"🔍 Début du cycle: {search_keywords} à {location}")
         
@@ -353,20 +1389,38 @@ class JobAutomationSystem:
             print("🧪 MODE TEST - Aucune vraie candidature ne sera envoyée")
         
         # 1. Scraping des offres
-        jobs = self.scraper.scrape_indeed(search_keywords, location, max_pages=2)
+        jobs = self.scraper.scrape_all(search_keywords, location, max_pages=2)
         
         if not jobs:
             print("❌ Aucune offre trouvée")
             return
         
-        # 2. Traitement des offres
-        profile_config = get_profile_config("data_scientist")  # Par défaut
+        # Descriptions complètes (la page de résultats n'en donne qu'un résumé)
+        if CRAWL_CONFIG["enrich_descriptions"]:
+            descriptions = self.enricher.run()
+            for job in jobs:
+                job.description = descriptions.get(job.id, job.description)
+        
+        # Une seule offre par groupe de doublons (multi-sites, republications)
+        if CRAWL_CONFIG["deduplicate"]:
+            jobs = self.duplicates.assign(jobs)
+        
+        # Les offres les plus pertinentes d'abord (seules les offres sans score sont notées)
+        scores = self.scoring.score_new()
+        # Offres déjà connues (crawl complet) : leur score enregistré est gardé
+        scores.update(self.db.get_scores(job.id for job in jobs if job.id not in scores))
+        jobs.sort(key=lambda job: scores.get(job.id, 0.0), reverse=True)
+        
+        # 2. Traitement des offres : tous les profils évalués en un passage par offre
+        matches = {job.id: self.profile_matcher.best(job.title, job.description) for job in jobs}
+        self.db.save_profiles({job_id: match.profile for job_id, match in matches.items()})
         
         for i, job in enumerate(jobs[:5]):  # Limite à 5 pour le test
-            print(f"\n📝 Traitement {i+1}/{min(5, len(jobs))}: {job.title}")
+            match = matches[job.id]
+            print(f"\n📝 Traitement {i+1}/{min(5, len(jobs))}: {job.title} (profil {match.profile})")
             
             # 3. Adaptation du CV
-            adapted_cv = self.cv_adapter.adapt_cv_for_job(job, profile_config)
+            adapted_cv = self.cv_adapter.adapt_cv_for_job(job, get_profile_config(match.profile), match)
             
             # 4. Candidature (simulée)
             if not dry_run:
@@ -377,41 +1431,60 @@ class JobAutomationSystem:
             
             if success:
                 # Mise à jour en base
-                conn = sqlite3.connect(self.db.db_path)
-                cursor = conn.cursor()
-                cursor.execute(
-                    'UPDATE jobs SET status = ?, cv_adapted = ?, application_date = ? WHERE id = ?',
-                    ('applied' if not dry_run else 'test', adapted_cv, datetime.now(), job.id)
+                self.db.update_job_status(
+                    job.id, 'applied' if not dry_run else 'test',
+                    cv_adapted=adapted_cv, application_date=datetime.now(),
+                    cv_base=self.cv_adapter.base_cv
                 )
-                conn.commit()
-                conn.close()
             
             # Pause entre candidatures
             time.sleep(random.uniform(2, 5))
         
         print(f"\n🎉 Cycle terminé! {len(jobs)} offres traitées")
+        
+        # Barrière : toutes les écritures du cycle sont durables avant la suite
+        self.db.flush()
+        writer_stats = self.db.writer_stats()
+        if writer_stats["commits"]:
+            print(f"💾 {writer_stats['committed']} écritures en {writer_stats['commits']} commits groupés")
+        for kind, timing in self.browser_pool.timing_stats().items():
+            print(f"⏱️  Selenium ({kind}): {timing['count']} pages prêtes en {timing['mean']:.2f} s "
+                  f"en moyenne (max {timing['max']:.2f} s)")
+        
+        # 5. Maintenance de la base (sauvegarde si due, purge, vacuum)
+        if maintenance:
+            self.run_maintenance()
+    
+    def run_maintenance(self, force_backup: bool = False) -> Dict:
+        """Lance les tâches de maintenance de la base"""
+        report = DatabaseMaintenance(self.db).run(force_backup=force_backup)
+        if report["backup"]:
+            print(f"💾 Sauvegarde créée: {report['backup']}")
+        return report
     
     def get_dashboard_data(self) -> Dict:
         """Récupère les données pour le dashboard"""
-        conn = sqlite3.connect(self.db.db_path)
-        
+        self.db.flush()
         try:
+            status_counts = self.db.get_status_counts()
             stats = {
-                'total_jobs': pd.read_sql('SELECT COUNT(*) as count FROM jobs', conn).iloc[0]['count'],
-                'applied': pd.read_sql('SELECT COUNT(*) as count FROM jobs WHERE status="applied" OR status="test"', conn).iloc[0]['count'],
+                'total_jobs': sum(status_counts.values()),
+                'applied': status_counts.get('applied', 0) + status_counts.get('test', 0),
                 'responded': 0,  # Pas de vraies réponses en mode demo
-                'recent_jobs': pd.read_sql('SELECT * FROM jobs ORDER BY date_scraped DESC LIMIT 10', conn)
+                'recent_jobs': pd.read_sql('SELECT * FROM jobs ORDER BY date_scraped DESC LIMIT 10',
+                                           self.db.get_connection())
             }
         except:
             stats = {'total_jobs': 0, 'applied': 0, 'responded': 0, 'recent_jobs': pd.DataFrame()}
         
-        conn.close()
         return stats
     
     def cleanup(self):
         """Nettoie les ressources"""
         self.scraper.close()
         self.application_bot.close()
+        self.browser_pool.close()
+        self.db.close()
 
 # Script principal
 if __name__ == "__main__":
@@ -0,0 +1,263 @@
+"""
+Recherche des mots-clés d'un profil dans le texte des offres
+
+Tous les mots-clés d'un profil sont compilés en une seule expression
+régulière (alternative factorisée en arbre de préfixes) : une offre est
+analysée en un seul passage, quel que soit le nombre de mots-clés. Texte
+et mots-clés sont comparés sans casse ni accents ("Données" == "donnees"),
+et "ai" ne correspond plus à "maintenance".
+
+Le texte est d'abord normalisé en octets (bytes.translate, en C) :
+minuscules, sans accents, ponctuation remplacée par des espaces. Les mots
+sont alors bornés par des espaces : l'expression commence par un espace
+littéral et n'est essayée qu'au début de chaque mot, et les
+correspondances sont déjà sous forme normalisée (pas de repli après
+coup).
+
+ProfileMatcher réunit les mots-clés de tous les profils de recherche dans
+une seule expression : chaque offre est évaluée pour tous les profils en un
+passage, le coût ne dépend pas du nombre de profils.
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set, Tuple
+
+_COMBINING_MARKS = re.compile("[\u0300-\u036f]")
+_WORD = re.compile(r"\w+")
+
+def fold(text: str) -> str:
+    """Minuscules sans accents (les longueurs ne sont pas conservées)"""
+    text = text or ""
+    if text.isascii():
+        return text.lower()
+    return _COMBINING_MARKS.sub("", unicodedata.normalize("NFKD", text)).casefold()
+
+@lru_cache(maxsize=4096)
+def _fold_char(char: str) -> bytes:
+    """Repli d'un caractère non ASCII : lettre sans accent ("é" -> "e",
+    "Œ" -> "oe"), espace pour le reste ("’", espace insécable...)"""
+    folded = fold(char)
+    return (folded if _WORD.fullmatch(folded) else " ").encode("utf-8")
+
+def _byte_tables() -> Tuple[bytes, bytes, bytes]:
+    """Tables bytes.translate du texte encodé en UTF-8
+
+    - ASCII : minuscules, ponctuation -> espace (octets non ASCII inchangés) ;
+    - Latin-1 : second octet de "À".."ÿ" -> lettre sans accent, pour les
+      caractères qui se replient en une seule lettre ASCII (le premier
+      octet, \\xc3, est supprimé) ;
+    - octets à supprimer pour vérifier qu'un texte ne contient que ceux-là.
+    """
+    ascii_table = bytearray(range(256))
+    for code in range(128):
+        char = chr(code)
+        if char.isupper():
+            ascii_table[code] = ord(char.lower())
+        elif not (char.isalnum() or char == "_"):
+            ascii_table[code] = ord(" ")
+
+    latin_table = bytearray(range(256))
+    latin_bytes = bytearray(b"\xc3")
+    for code in range(0xC0, 0x100):
+        folded = _fold_char(chr(code))
+        if len(folded) == 1 and folded.isalpha():
+            second = chr(code).encode("utf-8")[1]
+            latin_table[second] = folded[0]
+            latin_bytes.append(second)
+    return bytes(ascii_table), bytes(latin_table), bytes(latin_bytes)
+
+_ASCII_TABLE, _LATIN_TABLE, _LATIN_BYTES = _byte_tables()
+_ASCII_BYTES = bytes(range(128))
+
+def normalize(text: str) -> bytes:
+    """Texte en octets : minuscules, sans accents, mots séparés par des
+    espaces (un espace ajouté au début et à la fin)"""
+    data = b" " + (text or "").encode("utf-8").translate(_ASCII_TABLE) + b" "
+    if data.isascii():
+        return data
+    others = data.translate(None, _ASCII_BYTES)
+    if others.translate(None, _LATIN_BYTES):
+        # Autres caractères ("’", "œ"...) : remplacés un par un, une fois
+        # par caractère distinct (les lettres latines courantes sont laissées
+        # à la table si tous les remplacements sont ASCII)
+        chars = set(others.decode("utf-8", "ignore"))
+        replacements = {char: _fold_char(char) for char in chars}
+        if not all(replacement.isascii() for replacement in replacements.values()):
+            for char, replacement in replacements.items():
+                data = data.replace(char.encode("utf-8"), replacement)
+            return data
+        for char, replacement in replacements.items():
+            encoded = char.encode("utf-8")
+            if not (len(encoded) == 2 and encoded[0] == 0xC3 and encoded[1] in _LATIN_BYTES):
+                data = data.replace(encoded, replacement)
+    return data.translate(_LATIN_TABLE, b"\xc3")
+
+def _terms(keyword: str) -> bytes:
+    """Forme normalisée d'un mot-clé : ses mots séparés par un espace"""
+    return b" ".join(token.encode("utf-8") for token in _WORD.findall(fold(keyword)))
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Alternative regex factorisée par préfixes communs ("sql|scrum" -> "s(?:ql|crum)")"""
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict) -> str:
+        end = "" in node
+        branches = []
+        for char in sorted(key for key in node if key):
+            # Un espace du mot-clé accepte plusieurs espaces (ponctuation, retours à la ligne...)
+            prefix = " +" if char == " " else re.escape(char)
+            branches.append(prefix + build(node[char]))
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if end:
+            # Le mot complet est aussi une possibilité : essayée après les
+            # suites plus longues (correspondance la plus longue d'abord)
+            body = "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+class KeywordMatcher:
+    """Mots-clés compilés une fois, recherchés en un passage sur le texte normalisé
+
+    Un mot-clé dont la ponctuation compte ("c++", "c#") est recherché à part,
+    sur le texte replié (rare : pas de surcoût sinon).
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = list(dict.fromkeys(keywords))
+        self._order = {keyword: index for index, keyword in enumerate(self.keywords)}
+        # Forme normalisée -> mot-clé d'origine (le premier l'emporte en cas de doublon)
+        self._by_terms: Dict[bytes, str] = {}
+        self._special: List[Tuple[re.Pattern, bytes, bytes]] = []  # (expression, clé, mots sans ponctuation)
+        self._keys: Dict[str, bytes] = {}
+
+        words = []
+        for keyword in self.keywords:
+            terms = _terms(keyword)
+            self._keys[keyword] = terms
+            if not terms:
+                continue
+            folded = fold(keyword).strip()
+            if re.fullmatch(r"\w+(?:[\s'’-]+\w+)*", folded) is None:
+                # La clé garde la ponctuation : "c++", "c#" et "c" restent distincts
+                key = " ".join(folded.split()).encode("utf-8")
+                self._keys[keyword] = key
+                if key not in self._by_terms:
+                    pattern = re.compile(r"(?<!\w)" + r"\s+".join(map(re.escape, folded.split())) + r"(?!\w)")
+                    self._special.append((pattern, key, terms))
+                self._by_terms.setdefault(key, keyword)
+                continue
+            if terms not in self._by_terms:
+                words.append(terms.decode("utf-8"))
+            self._by_terms.setdefault(terms, keyword)
+
+        # Espace littéral en tête : l'expression n'est essayée qu'au début des mots
+        self._pattern = re.compile((" (" + _trie_pattern(words) + ")(?= )").encode("utf-8")) \
+            if words else None
+
+    def key(self, keyword: str) -> bytes:
+        """Forme normalisée d'un mot-clé de la liste (voir present_terms)"""
+        return self._keys[keyword]
+
+    def _scan(self, text: str) -> List[bytes]:
+        """Forme normalisée de chaque occurrence de mot-clé, dans l'ordre du texte
+        (les mots-clés à ponctuation en dernier)"""
+        found = self._pattern.findall(normalize(text)) if self._pattern else []
+        for index, terms in enumerate(found):
+            if terms not in self._by_terms:
+                found[index] = b" ".join(terms.split())  # Plusieurs espaces entre les mots
+        if self._special:
+            folded = fold(text)
+            for pattern, key, terms in self._special:
+                occurrences = len(pattern.findall(folded))
+                found.extend([key] * occurrences)
+                # Le texte de "c#" ne compte pas aussi pour le mot-clé "c"
+                for _ in range(occurrences):
+                    if terms in found:
+                        found.remove(terms)
+        return found
+
+    def present_terms(self, text: str) -> Set[bytes]:
+        """Formes normalisées des mots-clés présents dans le texte"""
+        return set(self._scan(text))
+
+    def counts(self, text: str) -> Counter:
+        """Nombre d'occurrences de chaque mot-clé trouvé"""
+        return Counter(map(self._by_terms.__getitem__, self._scan(text)))
+
+    def find_all(self, text: str) -> List[str]:
+        """Mots-clés présents dans le texte, dans l'ordre de la liste du profil"""
+        return sorted({self._by_terms[terms] for terms in self._scan(text)}, key=self._order.__getitem__)
+
+@lru_cache(maxsize=32)
+def get_matcher(keywords: tuple) -> KeywordMatcher:
+    """Matcher partagé pour une liste de mots-clés (compilé au premier appel)"""
+    return KeywordMatcher(keywords)
+
+def matcher_for_profile(profile_config: dict) -> KeywordMatcher:
+    return get_matcher(tuple(profile_config.get("target_keywords", [])))
+
+@dataclass(frozen=True)
+class ProfileMatch:
+    """Évaluation d'une offre pour un profil de recherche"""
+    profile: str
+    keywords: List[str]  # target_keywords trouvés, dans l'ordre du profil
+    score: float         # part des target_keywords trouvés (+ 1 si le profil est dans le titre)
+
+class ProfileMatcher:
+    """Évalue une offre pour tous les profils en un seul passage sur son texte
+
+    Le nom du profil ("data_scientist" -> "data scientist") est aussi
+    recherché : présent dans le titre de l'offre, il désigne presque à coup
+    sûr le bon profil.
+    """
+
+    def __init__(self, profiles: Dict[str, dict]):
+        self.profiles = list(profiles)
+        self._targets = {name: list(dict.fromkeys(config.get("target_keywords", [])))
+                         for name, config in profiles.items()}
+        self._titles = {name: name.replace("_", " ") for name in profiles}
+        keywords = [keyword for targets in self._targets.values() for keyword in targets] + list(self._titles.values())
+        self.matcher = KeywordMatcher(keywords)
+
+    def evaluate(self, title: str, text: str = "") -> Dict[str, ProfileMatch]:
+        """{profil: ProfileMatch} pour tous les profils"""
+        found = self.matcher.present_terms(f"{title or ''}\n{text or ''}")
+        # Le titre est court : son analyse séparée ne coûte presque rien
+        in_title = self.matcher.present_terms(title) if title else set()
+
+        key = self.matcher.key
+        results = {}
+        for name in self.profiles:
+            targets = self._targets[name]
+            hits = [keyword for keyword in targets if key(keyword) in found]
+            score = len(hits) / len(targets) if targets else 0.0
+            if key(self._titles[name]) in in_title:
+                score += 1.0
+            results[name] = ProfileMatch(name, hits, round(score, 4))
+        return results
+
+    def best(self, title: str, text: str = "") -> ProfileMatch:
+        """Profil le plus proche de l'offre (le premier déclaré en cas d'égalité)"""
+        results = self.evaluate(title, text)
+        return max(results.values(), key=lambda match: match.score)
+
+@lru_cache(maxsize=8)
+def _profile_matcher(profiles: tuple) -> ProfileMatcher:
+    return ProfileMatcher({name: {"target_keywords": list(keywords)} for name, keywords in profiles})
+
+def get_profile_matcher(profiles: Dict[str, dict]) -> ProfileMatcher:
+    """ProfileMatcher partagé pour un ensemble de profils (compilé au premier appel)"""
+    return _profile_matcher(tuple((name, tuple(config.get("target_keywords", [])))
+                                  for name, config in profiles.items()))
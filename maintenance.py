@@ -0,0 +1,192 @@
+"""
+Maintenance de la base de données : sauvegardes à chaud, purge des anciennes
+offres et vacuum incrémental (paramètres dans DATABASE_CONFIG)
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional
+
+from config import *
+
+# Intervalle minimal entre deux sauvegardes selon DATABASE_CONFIG["backup_frequency"]
+BACKUP_INTERVALS = {
+    "hourly": timedelta(hours=1),
+    "daily": timedelta(days=1),
+    "weekly": timedelta(weeks=1),
+}
+
+class DatabaseMaintenance:
+    """Tâches de maintenance d'une JobDatabase, exécutables pendant le scraping"""
+
+    def __init__(self, db: "JobDatabase", backup_dir: Path = None):
+        self.db = db
+        self.backup_dir = Path(backup_dir or DATABASE_CONFIG["backup_dir"])
+
+    def list_backups(self) -> list:
+        """Sauvegardes existantes, de la plus ancienne à la plus récente"""
+        if not self.backup_dir.exists():
+            return []
+        return sorted(self.backup_dir.glob("jobs_*.db"))
+
+    def backup_due(self) -> bool:
+        """Indique si une sauvegarde est nécessaire selon backup_frequency"""
+        backups = self.list_backups()
+        if not backups:
+            return True
+        interval = BACKUP_INTERVALS.get(DATABASE_CONFIG["backup_frequency"], BACKUP_INTERVALS["daily"])
+        last_backup = datetime.fromtimestamp(backups[-1].stat().st_mtime)
+        return datetime.now() - last_backup >= interval
+
+    def backup(self, pages_per_step: int = None) -> Path:
+        """Sauvegarde à chaud via l'API backup de SQLite
+
+        La copie avance par paquets de `pages_per_step` pages : les verrous
+        sont relâchés entre deux paquets, le scraper n'est donc pas bloqué.
+        """
+        pages_per_step = pages_per_step or DATABASE_CONFIG["backup_pages_per_step"]
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+
+        target_path = self.backup_dir / f"jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
+        tmp_path = target_path.with_suffix(".tmp")
+
+        def progress(status, remaining, total):
+            if total and remaining == 0:
+                print(f"💾 Sauvegarde: {total} pages copiées")
+
+        target = sqlite3.connect(tmp_path)
+        try:
+            self.db.get_connection().backup(target, pages=pages_per_step, progress=progress)
+        finally:
+            target.close()
+
+        # Renommage atomique : une sauvegarde visible est toujours complète
+        tmp_path.replace(target_path)
+        self.prune_backups()
+        return target_path
+
+    def prune_backups(self, keep: int = None) -> int:
+        """Supprime les sauvegardes au-delà des `keep` plus récentes"""
+        keep = keep if keep is not None else DATABASE_CONFIG["backup_keep"]
+        backups = self.list_backups()
+        obsolete = backups[:-keep] if keep > 0 else backups
+        for path in obsolete:
+            path.unlink()
+        return len(obsolete)
+
+    def purge_old_jobs(self, days: int = None, batch_size: int = None, archive: bool = True) -> int:
+        """Supprime (après archivage) les offres plus anciennes que `days` jours
+
+        Les suppressions se font par lots de `batch_size` lignes, chacun dans
+        sa propre transaction, pour ne jamais bloquer longtemps les écritures.
+        Les offres archivées (et leurs CV) sont copiées dans
+        DATABASE_CONFIG["archive_path"].
+        """
+        days = days if days is not None else DATABASE_CONFIG["cleanup_old_jobs_days"]
+        batch_size = batch_size or DATABASE_CONFIG["purge_batch_size"]
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat(" ")
+
+        conn = self.db.get_connection()
+        if archive:
+            self._attach_archive(conn)
+
+        purged = 0
+        try:
+            while True:
+                with self.db.transaction() as conn:
+                    rowids = [row[0] for row in conn.execute(
+                        "SELECT rowid FROM jobs WHERE date_scraped < ? LIMIT ?", (cutoff, batch_size)
+                    )]
+                    if not rowids:
+                        break
+
+                    placeholders = ", ".join("?" * len(rowids))
+                    if archive:
+                        self._archive_rows(conn, placeholders, rowids)
+                    conn.execute(f"DELETE FROM jobs WHERE rowid IN ({placeholders})", rowids)
+                    purged += len(rowids)
+        finally:
+            if archive:
+                conn.execute("DETACH DATABASE archive")
+
+        if purged:
+            print(f"🗑️  {purged} offres de plus de {days} jours purgées")
+        return purged
+
+    def _attach_archive(self, conn: sqlite3.Connection):
+        """Attache la base d'archive et aligne son schéma sur jobs / cv_artifacts"""
+        conn.execute("ATTACH DATABASE ? AS archive", (str(DATABASE_CONFIG["archive_path"]),))
+        for table in ("jobs", "cv_artifacts"):
+            columns = [(row[1], row[2]) for row in conn.execute(f"PRAGMA main.table_info({table})")]
+            key = columns[0][0]
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS archive.{table} ("
+                + ", ".join(f"{name} {kind}" + (" PRIMARY KEY" if name == key else "") for name, kind in columns)
+                + ")"
+            )
+            # Colonnes ajoutées par des migrations postérieures à la création de l'archive
+            archived = {row[1] for row in conn.execute(f"PRAGMA archive.table_info({table})")}
+            for name, kind in columns:
+                if name not in archived:
+                    conn.execute(f"ALTER TABLE archive.{table} ADD COLUMN {name} {kind}")
+
+    def _archive_rows(self, conn: sqlite3.Connection, placeholders: str, rowids: list):
+        """Copie un lot d'offres et les CV qu'elles référencent dans l'archive"""
+        columns = ", ".join(row[1] for row in conn.execute("PRAGMA main.table_info(jobs)"))
+        conn.execute(
+            f"INSERT OR REPLACE INTO archive.jobs ({columns}) "
+            f"SELECT {columns} FROM main.jobs WHERE rowid IN ({placeholders})", rowids
+        )
+
+        artifact_columns = ", ".join(row[1] for row in conn.execute("PRAGMA main.table_info(cv_artifacts)"))
+        referenced = f"SELECT cv_hash FROM main.jobs WHERE rowid IN ({placeholders})"
+        conn.execute(
+            f"INSERT OR IGNORE INTO archive.cv_artifacts ({artifact_columns}) "
+            f"SELECT {artifact_columns} FROM main.cv_artifacts WHERE hash IN ({referenced}) "
+            f"OR hash IN (SELECT base_hash FROM main.cv_artifacts WHERE hash IN ({referenced}))",
+            rowids + rowids
+        )
+
+    def purge_unused_cv_artifacts(self) -> int:
+        """Supprime les CV qui ne sont plus référencés par aucune offre"""
+        with self.db.transaction() as conn:
+            cursor = conn.execute(
+                """
+                DELETE FROM cv_artifacts
+                WHERE hash NOT IN (SELECT cv_hash FROM jobs WHERE cv_hash IS NOT NULL)
+                AND hash NOT IN (SELECT base_hash FROM cv_artifacts WHERE base_hash IS NOT NULL)
+                """
+            )
+            return cursor.rowcount
+
+    def incremental_vacuum(self, pages: int = None) -> int:
+        """Rend au système de fichiers jusqu'à `pages` pages libres
+
+        Une base créée avant l'activation de auto_vacuum=INCREMENTAL est
+        convertie une fois par un VACUUM complet.
+        """
+        pages = pages or DATABASE_CONFIG["vacuum_pages"]
+        conn = self.db.get_connection()
+
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            print("🧹 Conversion de la base en auto_vacuum incrémental (VACUUM complet, une seule fois)")
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+            return 0
+
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        conn.execute(f"PRAGMA incremental_vacuum({int(pages)})")
+        return min(free_pages, pages)
+
+    def run(self, force_backup: bool = False) -> Dict[str, Optional[object]]:
+        """Lance toutes les tâches : sauvegarde (si due), purge, vacuum"""
+        report = {"backup": None}
+
+        if force_backup or self.backup_due():
+            report["backup"] = self.backup()
+
+        report["purged_jobs"] = self.purge_old_jobs()
+        report["purged_cvs"] = self.purge_unused_cv_artifacts()
+        report["vacuumed_pages"] = self.incremental_vacuum()
+        return report
@@ -0,0 +1,248 @@
+"""
+Score de pertinence des offres (TF-IDF vectorisé, sans service externe)
+
+Les offres sont converties par lots en une matrice creuse (format CSR :
+tableaux indptr / indices / data NumPy) de poids TF-IDF normalisés. Chaque
+profil est un vecteur requête construit à partir de ses target_keywords et
+du CV de base ; le score d'une offre est sa similarité cosinus avec ces
+requêtes, calculée pour toutes les offres en une opération NumPy.
+
+La notation est incrémentale : seules les offres sans score sont
+vectorisées, avec les fréquences documentaires (IDF) cumulées des offres
+déjà notées, enregistrées dans la base. Le recalcul complet reste
+disponible (python startup.py rescore).
+"""
+
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from config import *
+
+def _byte_table() -> bytes:
+    """Table bytes.translate : minuscules, ponctuation ASCII -> espace"""
+    table = bytearray(range(256))
+    for code in range(128):
+        char = chr(code)
+        if char.isupper():
+            table[code] = ord(char.lower())
+        elif not (char.isalnum() or char == "_"):
+            table[code] = ord(" ")
+    return bytes(table)
+
+_BYTE_TABLE = _byte_table()
+
+# Clé des fréquences documentaires qui porte le nombre total d'offres
+DOCUMENT_COUNT = b""
+
+def tokenize(text: str) -> List[bytes]:
+    """Mots en minuscules, sans accents ni ponctuation (en octets ASCII)
+
+    Tout se fait en C (NFKD, encodage ASCII, translate, split) : les
+    caractères sans équivalent ASCII ("œ", symboles...) sont simplement
+    ignorés, de la même façon dans les offres et dans les requêtes.
+    """
+    text = text or ""
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+    return text.encode("ascii", "ignore").translate(_BYTE_TABLE).split()
+
+class SparseMatrix:
+    """Matrice creuse CSR minimale (lignes = documents, colonnes = termes)"""
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, data: np.ndarray, n_terms: int):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.n_terms = n_terms
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.indptr) - 1
+
+    def row_ids(self) -> np.ndarray:
+        """Numéro de ligne de chaque valeur non nulle"""
+        return np.repeat(np.arange(self.n_rows), np.diff(self.indptr))
+
+    def dot(self, vector: np.ndarray) -> np.ndarray:
+        """Produit matrice x vecteur dense"""
+        if not len(self.data):
+            return np.zeros(self.n_rows)
+        return np.bincount(self.row_ids(), weights=self.data * vector[self.indices], minlength=self.n_rows)
+
+    def normalize_rows(self):
+        """Normalise chaque ligne (norme L2), en place"""
+        norms = np.sqrt(np.bincount(self.row_ids(), weights=self.data ** 2, minlength=self.n_rows))
+        norms[norms == 0] = 1.0
+        self.data /= np.repeat(norms, np.diff(self.indptr))
+
+class TfidfScorer:
+    """Vectorise un corpus d'offres et le note contre les profils de recherche"""
+
+    def __init__(self, profiles: Dict[str, dict] = None, base_cv: str = "",
+                 keyword_weight: float = None, cv_weight: float = None):
+        self.profiles = profiles or SEARCH_PROFILES
+        self.base_cv = base_cv
+        self.keyword_weight = keyword_weight if keyword_weight is not None else SCORING_CONFIG["keyword_weight"]
+        self.cv_weight = cv_weight if cv_weight is not None else SCORING_CONFIG["cv_weight"]
+        # Un terme inconnu reçoit le numéro suivant au premier accès
+        self.vocabulary: Dict[bytes, int] = defaultdict()
+        self.vocabulary.default_factory = self.vocabulary.__len__
+
+    def vectorize(self, texts: Iterable[str]) -> SparseMatrix:
+        """Matrice des fréquences de termes (non pondérée) d'un lot de textes"""
+        term_id = self.vocabulary.__getitem__
+        indptr = [0]
+        indices: List[int] = []
+        counts: List[int] = []
+        for text in texts:
+            term_counts = Counter(tokenize(text))
+            indices.extend(map(term_id, term_counts))
+            counts.extend(term_counts.values())
+            indptr.append(len(indices))
+
+        return SparseMatrix(
+            np.asarray(indptr, dtype=np.int64),
+            np.asarray(indices, dtype=np.int32),
+            np.asarray(counts, dtype=np.float64),
+            len(self.vocabulary)
+        )
+
+    def _query(self, terms: Iterable[bytes], idf: np.ndarray) -> np.ndarray:
+        """Vecteur requête dense normalisé (termes inconnus du corpus ignorés)"""
+        query = np.zeros(len(idf))
+        for token in terms:
+            term_id = self.vocabulary.get(token)
+            if term_id is not None:
+                query[term_id] += idf[term_id]
+        norm = np.linalg.norm(query)
+        return query / norm if norm else query
+
+    def _accumulate(self, frequencies: Dict[bytes, int], df: np.ndarray, n_rows: int,
+                    query_terms: Iterable[bytes]) -> Tuple[np.ndarray, int]:
+        """Ajoute le lot aux fréquences cumulées ; retourne (df, nombre d'offres) du corpus"""
+        for term, count in zip(self.vocabulary, df.tolist()):
+            if count:
+                frequencies[term] = frequencies.get(term, 0) + count
+        frequencies[DOCUMENT_COUNT] = frequencies.get(DOCUMENT_COUNT, 0) + n_rows
+
+        # Termes des requêtes connus du corpus mais absents du lot : ils
+        # comptent dans la norme des requêtes, comme lors d'un recalcul complet
+        for term in query_terms:
+            if term in frequencies and term != DOCUMENT_COUNT:
+                self.vocabulary[term]  # Numéro attribué au premier accès
+        df = np.fromiter((frequencies.get(term, 0) for term in self.vocabulary), dtype=np.float64,
+                         count=len(self.vocabulary))
+        return df, frequencies[DOCUMENT_COUNT]
+
+    def score(self, texts: List[str], frequencies: Dict[bytes, int] = None) -> Tuple[np.ndarray, List[str]]:
+        """Scores (offres x profils) dans [0, 1] et noms des profils correspondants
+
+        Sans `frequencies`, l'IDF est calculé sur le lot lui-même (tout le
+        corpus noté d'un coup). Sinon le lot est ajouté, en place, à ces
+        fréquences documentaires cumulées {terme: offres} (DOCUMENT_COUNT :
+        nombre d'offres), qui donnent l'IDF : seul le lot est vectorisé.
+        """
+        matrix = self.vectorize(texts)
+        cv_terms = tokenize(self.base_cv)
+        names = list(self.profiles)
+        keyword_terms = [
+            [token for keyword in self.profiles[name].get("target_keywords", []) for token in tokenize(keyword)]
+            for name in names
+        ]
+
+        df = np.bincount(matrix.indices, minlength=matrix.n_terms)
+        n_docs = max(matrix.n_rows, 1)
+        if frequencies is not None:
+            query_terms = cv_terms + [token for terms in keyword_terms for token in terms]
+            df, n_docs = self._accumulate(frequencies, df, matrix.n_rows, query_terms)
+
+        # Poids TF-IDF : tf sous-linéaire (1 + log tf), idf lissé
+        idf = np.log((1 + n_docs) / (1 + df)) + 1.0
+        matrix.data = (1.0 + np.log(matrix.data)) * idf[matrix.indices]
+        matrix.normalize_rows()
+
+        cv_query = self._query(cv_terms, idf)
+        cv_scores = matrix.dot(cv_query) if self.base_cv else np.zeros(matrix.n_rows)
+
+        scores = np.empty((matrix.n_rows, len(names)))
+        for column, terms in enumerate(keyword_terms):
+            keyword_query = self._query(terms, idf)
+            scores[:, column] = self.keyword_weight * matrix.dot(keyword_query) + self.cv_weight * cv_scores
+        return scores, names
+
+def job_text(title: Optional[str], company: Optional[str], description: Optional[str],
+             requirements: Optional[str]) -> str:
+    """Texte noté d'une offre (le titre compte double : il résume le poste)"""
+    return " ".join(part for part in (title, title, company, description, requirements) if part)
+
+class ScoringEngine:
+    """Calcule et enregistre le score des offres d'une JobDatabase
+
+    score_new() ne note que les offres sans score, avec les fréquences
+    documentaires cumulées (table scoring_terms, gardées en mémoire entre
+    deux cycles) : le coût d'un cycle dépend du nombre de nouvelles offres,
+    pas de la taille de la base. Les scores déjà enregistrés ne suivent pas
+    l'évolution de l'IDF, et les offres purgées ou renotées restent
+    comptées : score_all() recalcule tout et repart de fréquences exactes.
+    """
+
+    COLUMNS = ["id", "title", "company", "description", "requirements"]
+
+    def __init__(self, db: "JobDatabase", base_cv: str = "", profiles: Dict[str, dict] = None):
+        self.db = db
+        self.base_cv = base_cv
+        self.profiles = profiles
+        self._frequencies: Optional[Dict[bytes, int]] = None
+
+    def _score(self, rows: Iterable[tuple], frequencies: Dict[bytes, int]) -> Tuple[Dict[str, float], TfidfScorer]:
+        """Note un lot d'offres, enregistre le score du profil le plus proche"""
+        ids, texts = [], []
+        for job_id, title, company, description, requirements in rows:
+            ids.append(job_id)
+            texts.append(job_text(title, company, description, requirements))
+        scorer = TfidfScorer(self.profiles, self.base_cv)
+        if not ids:
+            return {}, scorer
+
+        scores, _ = scorer.score(texts, frequencies)
+        best = scores.max(axis=1)
+        result = dict(zip(ids, best.round(4).tolist()))
+        self.db.save_scores(result)
+        return result, scorer
+
+    def score_all(self) -> Dict[str, float]:
+        """Note toutes les offres en un lot ; retourne {id: score}
+
+        Le score enregistré est celui du profil le plus proche de l'offre.
+        Les fréquences documentaires enregistrées sont remplacées.
+        """
+        self.db.flush()
+        frequencies: Dict[bytes, int] = {}
+        result, _ = self._score(self.db.iter_rows(self.COLUMNS), frequencies)
+        self.db.save_term_frequencies(frequencies, replace=True)
+        self._frequencies = frequencies
+        return result
+
+    def score_new(self) -> Dict[str, float]:
+        """Note les offres sans score seulement ; retourne {id: score} de celles-ci
+
+        Sans fréquences enregistrées (première notation, base migrée), toute
+        la base est notée (score_all).
+        """
+        self.db.flush()
+        if self._frequencies is None:
+            self._frequencies = self.db.get_term_frequencies()
+        if not self._frequencies:
+            return self.score_all()
+
+        frequencies = self._frequencies
+        result, scorer = self._score(self.db.iter_rows(self.COLUMNS, unscored=True), frequencies)
+        if result:
+            # Seuls les termes du lot (et le nombre d'offres) ont changé
+            changed = {term: frequencies[term] for term in scorer.vocabulary if term in frequencies}
+            changed[DOCUMENT_COUNT] = frequencies[DOCUMENT_COUNT]
+            self.db.save_term_frequencies(changed)
+        return result
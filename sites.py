@@ -0,0 +1,249 @@
+"""
+Parsing des pages des sites d'emploi (HTML -> données), sans navigateur
+
+Les fonctions prennent du HTML brut : elles s'appliquent aussi bien à une
+réponse HTTP qu'au page_source de Selenium, ou à une page sauvegardée.
+
+Chaque site est décrit par un SiteAdapter (URL des pages de résultats,
+parsing des cartes et des descriptions) enregistré dans SITE_ADAPTERS ;
+le scraper parcourt les sites activés dans SITES_CONFIG.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from urllib.parse import quote_plus, urljoin
+
+from lxml import etree, html as lxml_html
+
+from config import *
+
+# Marqueurs d'une page qui ne contient pas les offres sans exécuter de JavaScript
+# (challenge anti-bot, squelette d'application)
+JAVASCRIPT_MARKERS = (
+    "cf-challenge",
+    "challenge-platform",
+    "Just a moment...",
+    "enable JavaScript",
+    "Activez JavaScript",
+)
+
+def needs_javascript(html: str, status_code: int = 200) -> bool:
+    """Indique si la page doit être rechargée avec Selenium"""
+    if status_code in (401, 403, 429) or not html:
+        return True
+    return any(marker in html for marker in JAVASCRIPT_MARKERS)
+
+def indeed_listing_url(keywords: str, location: str, page: int) -> str:
+    """URL d'une page de résultats Indeed (10 offres par page)"""
+    base_url = f"https://fr.indeed.com/jobs?q={keywords.replace(' ', '+')}&l={location.replace(' ', '+')}"
+    return f"{base_url}&start={page * 10}"
+
+def indeed_job_url(job_id: str) -> str:
+    return f"https://fr.indeed.com/viewjob?jk={job_id}"
+
+# Sélecteurs compilés une fois (équivalents XPath des sélecteurs CSS Selenium)
+_INDEED_CARDS = etree.XPath("//*[@data-jk]")
+_INDEED_TITLE = etree.XPath("normalize-space((.//h2//a//span)[1])")
+_INDEED_COMPANY = etree.XPath("normalize-space((.//*[@data-testid='company-name'])[1])")
+_INDEED_LOCATION = etree.XPath("normalize-space((.//*[@data-testid='job-location'])[1])")
+_INDEED_DESCRIPTION = etree.XPath("//*[@id='jobDescriptionText']")
+
+def parse_indeed_listing(html: str) -> List[Dict[str, Optional[str]]]:
+    """Extrait en une passe toutes les cartes d'offres d'une page de résultats Indeed"""
+    if not html or not html.strip():
+        return []
+    tree = lxml_html.fromstring(html)
+    cards = []
+
+    for card in _INDEED_CARDS(tree):
+        title = _INDEED_TITLE(card)
+        if not title:
+            continue
+
+        job_id = card.get("data-jk")
+        cards.append({
+            "id": job_id,
+            "title": title,
+            "company": _INDEED_COMPANY(card) or None,
+            "location": _INDEED_LOCATION(card) or None,
+            "url": indeed_job_url(job_id),
+        })
+
+    return cards
+
+def parse_indeed_description(html: str) -> Optional[str]:
+    """Extrait la description complète d'une page d'offre Indeed"""
+    if not html or not html.strip():
+        return None
+    matches = _INDEED_DESCRIPTION(lxml_html.fromstring(html))
+    if not matches:
+        return None
+    lines = (text.strip() for text in matches[0].itertext())
+    return "\n".join(line for line in lines if line)
+
+def _description_parser(xpath: str) -> Callable[[str], Optional[str]]:
+    """Parser de description : texte du premier élément trouvé par `xpath`"""
+    find = etree.XPath(xpath)
+
+    def parse(html: str) -> Optional[str]:
+        if not html or not html.strip():
+            return None
+        matches = find(lxml_html.fromstring(html))
+        if not matches:
+            return None
+        lines = (text.strip() for text in matches[0].itertext())
+        return "\n".join(line for line in lines if line) or None
+
+    return parse
+
+def _link_listing_parser(base_url: str, cards: str, link: str, id_pattern: str, title: str,
+                         company: str, location: str) -> Callable[[str], List[Dict[str, Optional[str]]]]:
+    """Parser de page de résultats pour les sites dont l'identifiant d'offre est dans le lien
+
+    Les expressions XPath sont compilées une fois ; `id_pattern` extrait
+    l'identifiant de l'URL de l'offre (premier groupe).
+    """
+    find_cards = etree.XPath(cards)
+    find_link = etree.XPath(f"string(({link})[1]/@href)")
+    # Premier élément non vide de chaque union
+    find_title = etree.XPath(f"normalize-space((({title})[normalize-space()])[1])")
+    find_company = etree.XPath(f"normalize-space((({company})[normalize-space()])[1])")
+    find_location = etree.XPath(f"normalize-space((({location})[normalize-space()])[1])")
+    job_id = re.compile(id_pattern)
+
+    def parse(html: str) -> List[Dict[str, Optional[str]]]:
+        if not html or not html.strip():
+            return []
+        results = []
+        for card in find_cards(lxml_html.fromstring(html)):
+            href = find_link(card)
+            match = job_id.search(href) if href else None
+            card_title = find_title(card)
+            if not match or not card_title:
+                continue
+            results.append({
+                "id": match.group(1),
+                "title": card_title,
+                "company": find_company(card) or None,
+                "location": find_location(card) or None,
+                "url": urljoin(base_url, href),
+            })
+        return results
+
+    return parse
+
+@dataclass(frozen=True)
+class SiteAdapter:
+    """Ce qu'il faut savoir d'un site pour en récupérer les offres"""
+    name: str
+    listing_url: Callable[[str, str, int], str]  # (mots-clés, lieu, page à partir de 0) -> URL
+    parse_listing: Callable[[str], List[Dict[str, Optional[str]]]]
+    parse_description: Callable[[str], Optional[str]]
+    cookie_button_id: Optional[str] = None  # Bandeau cookies à fermer sous Selenium
+    # Sélecteurs CSS signalant, sous Selenium, qu'une page est exploitable
+    listing_ready: str = "body"
+    description_ready: str = "body"
+    # Pages de résultats vides sans JavaScript : Selenium d'office
+    javascript_only: bool = False
+
+    @property
+    def config(self) -> Dict:
+        return SITES_CONFIG.get(self.name, {})
+
+SITE_ADAPTERS: Dict[str, SiteAdapter] = {}
+
+def register_site(adapter: SiteAdapter) -> SiteAdapter:
+    SITE_ADAPTERS[adapter.name] = adapter
+    return adapter
+
+def get_site_adapter(name: str) -> Optional[SiteAdapter]:
+    return SITE_ADAPTERS.get(name)
+
+def enabled_sites(sites_config: Dict = None) -> List[SiteAdapter]:
+    """Adaptateurs des sites activés, par priorité croissante"""
+    sites_config = sites_config or SITES_CONFIG
+    names = sorted(
+        (name for name, site in sites_config.items() if site.get("enabled") and name in SITE_ADAPTERS),
+        key=lambda name: sites_config[name].get("priority", 99)
+    )
+    return [SITE_ADAPTERS[name] for name in names]
+
+register_site(SiteAdapter(
+    name="indeed",
+    listing_url=indeed_listing_url,
+    parse_listing=parse_indeed_listing,
+    parse_description=parse_indeed_description,
+    cookie_button_id="onetrust-accept-btn-handler",
+    listing_ready="[data-jk]",
+    description_ready="#jobDescriptionText",
+))
+
+register_site(SiteAdapter(
+    name="welcome_to_the_jungle",
+    listing_url=lambda keywords, location, page: (
+        f"https://www.welcometothejungle.com/fr/jobs?query={quote_plus(keywords)}"
+        f"&aroundQuery={quote_plus(location)}&page={page + 1}"
+    ),
+    parse_listing=_link_listing_parser(
+        "https://www.welcometothejungle.com",
+        cards="//li[.//a[contains(@href, '/jobs/')]]",
+        link=".//a[contains(@href, '/jobs/')]",
+        id_pattern=r"/companies/[^/]+/jobs/([^/?#]+)",
+        title=".//h2 | .//h3 | .//h4",
+        company=".//*[contains(@data-testid, 'company')] | .//span[contains(@class, 'company')]",
+        location=".//*[contains(@data-testid, 'location')] | .//i[@name='location']/following-sibling::*",
+    ),
+    parse_description=_description_parser(
+        "//*[@data-testid='job-section-description'] | //*[@id='the-position-section']"
+    ),
+    cookie_button_id="axeptio_btn_acceptAll",
+    listing_ready="a[href*='/jobs/']",
+    description_ready="[data-testid='job-section-description'], #the-position-section",
+))
+
+register_site(SiteAdapter(
+    name="hellowork",
+    listing_url=lambda keywords, location, page: (
+        f"https://www.hellowork.com/fr-fr/emploi/recherche.html?k={quote_plus(keywords)}"
+        f"&l={quote_plus(location)}&p={page + 1}"
+    ),
+    parse_listing=_link_listing_parser(
+        "https://www.hellowork.com",
+        cards="//li[.//a[contains(@href, '/emplois/')]]",
+        link=".//a[contains(@href, '/emplois/')]",
+        id_pattern=r"/emplois/(\d+)\.html",
+        title=".//h3 | .//a[contains(@href, '/emplois/')]//p[1]",
+        company=".//a[contains(@href, '/emplois/')]//p[2] | .//*[contains(@class, 'company')]",
+        location=".//*[@data-cy='localisationCard'] | .//*[contains(@class, 'location')]",
+    ),
+    parse_description=_description_parser(
+        "//*[@data-truncate-text-target='content'] | //section[contains(@class, 'description')]"
+    ),
+    cookie_button_id="hw-cc-notice-accept-btn",
+    listing_ready="a[href*='/emplois/']",
+    description_ready="[data-truncate-text-target='content'], section[class*='description']",
+))
+
+register_site(SiteAdapter(
+    name="monster",
+    listing_url=lambda keywords, location, page: (
+        f"https://www.monster.fr/emploi/recherche?q={quote_plus(keywords)}"
+        f"&where={quote_plus(location)}&page={page + 1}"
+    ),
+    parse_listing=_link_listing_parser(
+        "https://www.monster.fr",
+        cards="//*[@data-testid='svx_jobCard'] | //article[.//a[contains(@href, '/job-openings/')]]",
+        link=".//a[contains(@href, '/job-openings/')]",
+        id_pattern=r"/job-openings/[^?#]*?([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})",
+        title=".//h3 | .//h2",
+        company=".//*[@data-testid='company']",
+        location=".//*[@data-testid='jobCardLocation']",
+    ),
+    parse_description=_description_parser(
+        "//*[@data-testid='svx-description-container-inner'] | //*[contains(@class, 'job-description')]"
+    ),
+    cookie_button_id="onetrust-accept-btn-handler",
+    listing_ready="a[href*='/job-openings/']",
+    description_ready="[data-testid='svx-description-container-inner'], [class*='job-description']",
+))
@@ -105,7 +105,7 @@ def run_automation(profile: str, dry_run: bool = False):
         return True
     
     try:
-        system = JobAutomationSystem(OPENAI_API_KEY)
+        system = JobAutomationSystem()
         system.run_full_cycle(
             search_keywords=profile_config["keywords"],
             location=profile_config["location"]
@@ -127,11 +127,94 @@ def run_automation(profile: str, dry_run: bool = False):
         if 'system' in locals():
             system.cleanup()
 
+def rebuild_stats():
+    """Vérifie et recalcule les compteurs agrégés du dashboard"""
+    from job_automation_system import JobDatabase
+    
+    db = JobDatabase()
+    try:
+        differences = db.check_stats()
+        if not differences:
+            print("✅ Compteurs cohérents avec la table jobs")
+        else:
+            for table, rows in differences.items():
+                print(f"⚠️  {table}: {len(rows)} écart(s)")
+                for key, stored, expected in rows[:10]:
+                    print(f"   - {key or '(vide)'}: {stored} au lieu de {expected}")
+        
+        db.rebuild_stats()
+        print("🔄 Compteurs recalculés")
+    finally:
+        db.close()
+
+def run_maintenance(force_backup: bool = False):
+    """Sauvegarde, purge des anciennes offres et vacuum incrémental"""
+    from job_automation_system import JobDatabase
+    from maintenance import DatabaseMaintenance
+    
+    db = JobDatabase()
+    try:
+        report = DatabaseMaintenance(db).run(force_backup=force_backup)
+        print(f"💾 Sauvegarde: {report['backup'] or 'non nécessaire'}")
+        print(f"🗑️  Offres purgées: {report['purged_jobs']}")
+        print(f"🗑️  CV orphelins supprimés: {report['purged_cvs']}")
+        print(f"🧹 Pages libérées: {report['vacuumed_pages']}")
+    finally:
+        db.close()
+
+def run_export(fmt: str, output: str = None, columns: str = None, status: str = None,
+               since: str = None, until: str = None):
+    """Exporte les offres (CSV, Excel ou Parquet) en flux"""
+    from datetime import datetime
+    from job_automation_system import JobDatabase
+    from export import export_jobs
+    
+    db = JobDatabase()
+    try:
+        export_jobs(
+            db, fmt,
+            output=Path(output) if output else None,
+            columns=[c.strip() for c in columns.split(",")] if columns else None,
+            status=status,
+            since=datetime.fromisoformat(since) if since else None,
+            until=datetime.fromisoformat(until) if until else None
+        )
+        return True
+    except (ValueError, ImportError) as e:
+        print(f"❌ Export impossible: {e}")
+        return False
+    finally:
+        db.close()
+
+def run_batch_adapt(status: str = "scraped", workers: int = None, force: bool = False, limit: int = None):
+    """Adapte en parallèle le CV de toutes les offres d'un statut"""
+    from job_automation_system import JobDatabase
+    from batch_adapt import BatchAdapter
+    
+    db = JobDatabase()
+    try:
+        BatchAdapter(db, workers=workers).run(status=status, force=force, limit=limit)
+    finally:
+        db.close()
+
+def run_rescore():
+    """Recalcule le score de pertinence de toutes les offres (IDF exact)"""
+    from job_automation_system import CVAdapterFree, JobDatabase
+    from scoring import ScoringEngine
+    
+    db = JobDatabase()
+    try:
+        scores = ScoringEngine(db, base_cv=CVAdapterFree().base_cv).score_all()
+        db.flush()
+        print(f"📊 {len(scores)} offres notées")
+    finally:
+        db.close()
+
 def main():
     """Point d'entrée principal"""
     parser = argparse.ArgumentParser(description="Système de candidature automatique")
     
-    parser.add_argument("command", choices=["dashboard", "run", "setup", "validate"], 
+    parser.add_argument("command", choices=["dashboard", "run", "setup", "validate", "rebuild-stats", "maintenance", "export", "adapt", "rescore"], 
                        help="Commande à exécuter")
     
     parser.add_argument("--profile", default=DEFAULT_PROFILE,
@@ -141,8 +224,28 @@ def main():
     parser.add_argument("--dry-run", action="store_true",
                        help="Mode test sans envoi de candidatures")
     
+    parser.add_argument("--force-backup", action="store_true",
+                       help="Maintenance : sauvegarde même si elle n'est pas encore due")
+    
+    parser.add_argument("--format", default="csv", choices=DATABASE_CONFIG["export_formats"],
+                       help="Export : format du fichier")
+    parser.add_argument("--output", help="Export : chemin du fichier (défaut: data/exports/)")
+    parser.add_argument("--columns", help="Export : colonnes séparées par des virgules")
+    parser.add_argument("--status", help="Export / adapt : uniquement les offres de ce statut (adapt : scraped par défaut)")
+    parser.add_argument("--since", help="Export : offres scrapées depuis cette date (AAAA-MM-JJ)")
+    parser.add_argument("--until", help="Export : offres scrapées avant cette date (AAAA-MM-JJ)")
+    parser.add_argument("--workers", type=int, help="Adapt : nombre de processus (défaut: nombre de cœurs)")
+    parser.add_argument("--limit", type=int, help="Adapt : nombre maximum d'offres")
+    parser.add_argument("--force", action="store_true",
+                       help="Adapt : adapte aussi les offres qui ont déjà un CV adapté")
+    parser.add_argument("--http-cache", choices=["off", "cache", "record", "replay"],
+                       help="Cache des réponses HTTP (replay : rejeu hors ligne, sans requête)")
+    
     args = parser.parse_args()
     
+    if args.http_cache:
+        HTTP_CACHE_CONFIG["mode"] = args.http_cache
+    
     # Configuration du logging
     setup_logging()
     
@@ -158,6 +261,11 @@ def main():
         print("  - python startup.py dashboard  # Lance l'interface web")
         print("  - python startup.py run        # Lance l'automatisation")
         print("  - python startup.py validate   # Valide la configuration")
+        print("  - python startup.py rebuild-stats  # Vérifie et recalcule les statistiques")
+        print("  - python startup.py maintenance    # Sauvegarde, purge et vacuum de la base")
+        print("  - python startup.py export --format excel  # Exporte les offres")
+        print("  - python startup.py adapt      # Adapte le CV de toutes les offres en parallèle")
+        print("  - python startup.py rescore    # Recalcule le score de toutes les offres")
     
     elif args.command == "validate":
         validate_config()
@@ -165,6 +273,23 @@ def main():
     elif args.command == "dashboard":
         run_dashboard()
     
+    elif args.command == "rebuild-stats":
+        rebuild_stats()
+    
+    elif args.command == "maintenance":
+        run_maintenance(args.force_backup)
+    
+    elif args.command == "export":
+        success = run_export(args.format, args.output, args.columns, args.status, args.since, args.until)
+        if not success:
+            sys.exit(1)
+    
+    elif args.command == "adapt":
+        run_batch_adapt(args.status or "scraped", args.workers, args.force, args.limit)
+    
+    elif args.command == "rescore":
+        run_rescore()
+    
     elif args.command == "run":
         success = run_automation(args.profile, args.dry_run)
         if not success:
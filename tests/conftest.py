@@ -0,0 +1,6 @@
+"""Configuration pytest : modules du projet importables depuis tests/"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
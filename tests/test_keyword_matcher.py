@@ -0,0 +1,34 @@
+"""
+Recherche des mots-clés (keyword_matcher.py) : bornes de mots, accents,
+mots-clés dont la ponctuation compte
+"""
+
+import pytest
+
+from keyword_matcher import KeywordMatcher, ProfileMatcher
+
+def test_words_accents_and_phrases():
+    matcher = KeywordMatcher(["python", "données", "machine learning", "ai"])
+    text = "Python, Machine\nLearning ; maintenance des DONNEES"
+    assert matcher.find_all(text) == ["python", "données", "machine learning"]
+
+@pytest.mark.parametrize("text, expected", [
+    ("Expert C# et .NET", ["c#", ".net"]),
+    ("Langage C requis", ["c"]),
+    ("C++ moderne", ["c++"]),
+    ("C, C++ et C#", ["c++", "c#", "c"]),
+])
+def test_punctuation_keywords_stay_distinct(text, expected):
+    matcher = KeywordMatcher(["c++", "c#", "c", ".net"])
+    assert matcher.find_all(text) == expected
+
+def test_punctuation_keyword_counts():
+    matcher = KeywordMatcher(["c++", "c#", "c"])
+    assert matcher.counts("C++ puis C# puis C++ et C") == {"c++": 2, "c#": 1, "c": 1}
+
+def test_profile_matcher_punctuation_keywords():
+    matcher = ProfileMatcher({"cpp": {"target_keywords": ["c++", "linux"]},
+                              "dotnet": {"target_keywords": ["c#", "azure"]}})
+    results = matcher.evaluate("Développeur C#", "Azure et SQL Server")
+    assert results["dotnet"].keywords == ["c#", "azure"]
+    assert results["cpp"].keywords == []
@@ -0,0 +1,84 @@
+"""
+Parsers des sites d'emploi testés hors ligne sur des pages enregistrées
+
+Chaque adaptateur de sites.py a sa page de résultats et sa page d'offre
+dans tests/fixtures/sites/ (<site>_listing.html, <site>_description.html).
+"""
+
+from pathlib import Path
+
+import pytest
+
+from sites import SITE_ADAPTERS, get_site_adapter, needs_javascript
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "sites"
+
+# Cartes attendues (id, titre, entreprise, lieu) et extrait de chaque description
+EXPECTED = {
+    "indeed": {
+        "cards": [
+            ("5f2c8a91d3b4e607", "Data Scientist H/F", "Société Générale", "Paris (75)"),
+            ("0a7e41c2b9d85f13", "Data Analyst - Power BI (CDI)", "Doctolib", "Levallois-Perret (92)"),
+            ("c39b0e58f16a2d74", "Scrum Master / Agile Coach", "SNCF Connect & Tech", None),
+        ],
+        "url": "https://fr.indeed.com/viewjob?jk=5f2c8a91d3b4e607",
+        "description": "industrialisez des modèles de machine learning",
+    },
+    "welcome_to_the_jungle": {
+        "cards": [
+            ("data-scientist-credit-risk_paris_QONTO_8xRk2Lp", "Data Scientist - Credit Risk", "Qonto", "Paris"),
+            ("senior-data-analyst_paris", "Senior Data Analyst", "Alan", "Paris"),
+        ],
+        "url": "https://www.welcometothejungle.com/fr/companies/qonto/jobs/data-scientist-credit-risk_paris_QONTO_8xRk2Lp",
+        "description": "construire nos modèles de scoring",
+    },
+    "hellowork": {
+        "cards": [
+            ("58412937", "Data Scientist H/F", "Groupe Renault", "Boulogne-Billancourt - 92"),
+            ("58399104", "Chef de Projet Data / Scrum Master F/H", "Crédit Agricole CIB", "Montrouge - 92"),
+        ],
+        "url": "https://www.hellowork.com/fr-fr/emplois/58412937.html",
+        "description": "Environnement technique : Python, Spark, SQL.",
+    },
+    "monster": {
+        "cards": [
+            ("3f6d2a1b-8c4e-4b7a-9d15-0e2f6a7c8b91", "Data Scientist", "Capgemini", "Paris, Île-de-France"),
+            ("7b1e9c04-2d3f-4a5b-8c6d-9e0f1a2b3c4d", "Data Analyst Junior", "Sopra Steria",
+             "Lyon, Auvergne-Rhône-Alpes"),
+        ],
+        "url": "https://www.monster.fr/job-openings/data-scientist-paris-75--3f6d2a1b-8c4e-4b7a-9d15-0e2f6a7c8b91?sid=abc",
+        "description": "Déploiement de modèles NLP",
+    },
+}
+
+def _fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+def test_every_adapter_has_fixtures():
+    assert set(EXPECTED) == set(SITE_ADAPTERS)
+
+@pytest.mark.parametrize("site", sorted(EXPECTED))
+def test_parse_listing(site):
+    html = _fixture(f"{site}_listing.html")
+    cards = get_site_adapter(site).parse_listing(html)
+
+    assert [(card["id"], card["title"], card["company"], card["location"]) for card in cards] \
+        == EXPECTED[site]["cards"]
+    assert cards[0]["url"] == EXPECTED[site]["url"]
+    assert not needs_javascript(html)
+
+@pytest.mark.parametrize("site", sorted(EXPECTED))
+def test_parse_description(site):
+    description = get_site_adapter(site).parse_description(_fixture(f"{site}_description.html"))
+
+    assert EXPECTED[site]["description"] in description
+    assert "<" not in description
+    assert "\n\n" not in description
+
+@pytest.mark.parametrize("site", sorted(EXPECTED))
+def test_parsers_ignore_empty_pages(site):
+    adapter = get_site_adapter(site)
+    assert adapter.parse_listing("") == []
+    assert adapter.parse_listing("<html><body><p>Aucune offre</p></body></html>") == []
+    assert adapter.parse_description("") is None
+    assert adapter.parse_description("<html><body></body></html>") is None